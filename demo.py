@@ -14,91 +14,113 @@ Run: python demo.py
 import asyncio
 import sys
 import os
+from dataclasses import dataclass
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# uvloop is a faster drop-in event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-from dotenv import load_dotenv
-load_dotenv()
 
-from src.agent.agent import FinAgent
-from src.agent.config import config
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """A single demo scenario"""
+    name: str
+    command: str
+    description: str
+    approval_needed: bool
 
 
 DEMO_SCENARIOS = [
-    {
-        "name": "🔐 Login",
-        "command": "login to my account",
-        "description": "Agent navigates to bank and logs in automatically",
-        "approval_needed": False
-    },
-    {
-        "name": "💰 Check Balance",
-        "command": "check my account balance",
-        "description": "Agent reads balance from dashboard using Vision AI",
-        "approval_needed": False
-    },
-    {
-        "name": "💡 Pay Electricity Bill",
-        "command": "pay electricity bill of 1250 rupees to Adani Power",
-        "description": "Agent fills payment form and pauses for approval",
-        "approval_needed": True
-    },
-    {
-        "name": "🥇 Buy Digital Gold",
-        "command": "buy gold worth 1000 rupees",
-        "description": "Agent navigates to gold section and prepares purchase",
-        "approval_needed": True
-    },
-    {
-        "name": "💸 Fund Transfer",
-        "command": "transfer 2000 rupees to Mom",
-        "description": "Agent selects beneficiary and prepares transfer",
-        "approval_needed": True
-    },
+    Scenario(
+        name="🔐 Login",
+        command="login to my account",
+        description="Agent navigates to bank and logs in automatically",
+        approval_needed=False
+    ),
+    Scenario(
+        name="💰 Check Balance",
+        command="check my account balance",
+        description="Agent reads balance from dashboard using Vision AI",
+        approval_needed=False
+    ),
+    Scenario(
+        name="💡 Pay Electricity Bill",
+        command="pay electricity bill of 1250 rupees to Adani Power",
+        description="Agent fills payment form and pauses for approval",
+        approval_needed=True
+    ),
+    Scenario(
+        name="🥇 Buy Digital Gold",
+        command="buy gold worth 1000 rupees",
+        description="Agent navigates to gold section and prepares purchase",
+        approval_needed=True
+    ),
+    Scenario(
+        name="💸 Fund Transfer",
+        command="transfer 2000 rupees to Mom",
+        description="Agent selects beneficiary and prepares transfer",
+        approval_needed=True
+    ),
 ]
 
 
+# Banner and menu text is fixed, so build it once at import time
+HEADER = "\n".join([
+    "",
+    "=" * 70,
+    "   🤖 FinAgent - AI-Powered Financial Automation Demo",
+    "   IIT Bombay Techfest × Jio Financial Services",
+    "=" * 70,
+    "",
+    "   👁️  Vision AI:     Gemini 1.5 Flash (FREE)",
+    "   🌐 Browser:       Playwright",
+    "   🛡️  Safety:        Conscious Pause Mechanism",
+    "   🎤 Voice:         Web Speech API (FREE)",
+    "",
+    "=" * 70,
+])
+
+SCENARIO_MENU = "\n".join([
+    "📋 Available Demo Scenarios:",
+    "-" * 40,
+    *(
+        f"   {i + 1}. {scenario.name} {'⚠️' if scenario.approval_needed else '✅'}"
+        for i, scenario in enumerate(DEMO_SCENARIOS)
+    ),
+    "",
+    "   0. Run all demos",
+    "   q. Quit",
+    "-" * 40,
+])
+
+
 def print_header():
     """Print demo header"""
-    print("\n" + "="*70)
-    print("   🤖 FinAgent - AI-Powered Financial Automation Demo")
-    print("   IIT Bombay Techfest × Jio Financial Services")
-    print("="*70)
-    print()
-    print("   👁️  Vision AI:     Gemini 1.5 Flash (FREE)")
-    print("   🌐 Browser:       Playwright")
-    print("   🛡️  Safety:        Conscious Pause Mechanism")
-    print("   🎤 Voice:         Web Speech API (FREE)")
-    print()
-    print("="*70)
+    print(HEADER)
 
 
-def print_scenario(scenario: dict, index: int):
+def print_scenario(scenario: Scenario, index: int):
     """Print scenario details"""
     print(f"\n{'='*70}")
-    print(f"   Demo {index + 1}: {scenario['name']}")
+    print(f"   Demo {index + 1}: {scenario.name}")
     print(f"{'='*70}")
-    print(f"\n   📝 Command: \"{scenario['command']}\"")
-    print(f"   📖 {scenario['description']}")
-    if scenario['approval_needed']:
+    print(f"\n   📝 Command: \"{scenario.command}\"")
+    print(f"   📖 {scenario.description}")
+    if scenario.approval_needed:
         print(f"   ⚠️  This action requires APPROVAL")
     print()
 
 
 async def run_interactive_demo():
     """Run interactive demo"""
+    from src.agent.agent import FinAgent, ainput
+    from src.agent.browser_automation import shutdown_browser_pool
+    
     print_header()
     
-    print("📋 Available Demo Scenarios:")
-    print("-" * 40)
-    for i, scenario in enumerate(DEMO_SCENARIOS):
-        approval = "⚠️" if scenario['approval_needed'] else "✅"
-        print(f"   {i+1}. {scenario['name']} {approval}")
-    print()
-    print("   0. Run all demos")
-    print("   q. Quit")
-    print("-" * 40)
+    print(SCENARIO_MENU)
     
     agent = FinAgent()
     
@@ -108,32 +130,35 @@ async def run_interactive_demo():
         print("✅ Agent ready!")
         
         while True:
-            choice = input("\n🎯 Enter scenario number (or 'q' to quit): ").strip()
+            choice = (await ainput("\n🎯 Enter scenario number (or 'q' to quit): ")).strip()
             
             if choice.lower() == 'q':
                 break
             
             if choice == '0':
-                # Run all demos
-                for i, scenario in enumerate(DEMO_SCENARIOS):
+                # Run all demos: read-only scenarios first as one batch, then
+                # the ones that need approval, each behind an ENTER prompt.
+                # Scenarios share the agent's single browser page (and balance
+                # depends on login), so they run in order rather than concurrently.
+                ordered = sorted(enumerate(DEMO_SCENARIOS), key=lambda item: item[1].approval_needed)
+                for i, scenario in ordered:
                     print_scenario(scenario, i)
                     
-                    input("   Press ENTER to execute...")
+                    if scenario.approval_needed:
+                        await ainput("   Press ENTER to execute...")
                     
-                    result = await agent.execute(scenario['command'])
+                    result = await agent.execute(scenario.command)
                     
                     print(f"\n   📊 Result: {result['status']}")
                     print(f"   📈 Steps completed: {result['steps_completed']}/{result['total_steps']}")
-                    
-                    await asyncio.sleep(1)
             
             elif choice.isdigit() and 1 <= int(choice) <= len(DEMO_SCENARIOS):
                 scenario = DEMO_SCENARIOS[int(choice) - 1]
                 print_scenario(scenario, int(choice) - 1)
                 
-                input("   Press ENTER to execute...")
+                await ainput("   Press ENTER to execute...")
                 
-                result = await agent.execute(scenario['command'])
+                result = await agent.execute(scenario.command)
                 
                 print(f"\n   📊 Result: {result['status']}")
                 print(f"   📈 Steps completed: {result['steps_completed']}/{result['total_steps']}")
@@ -147,11 +172,15 @@ async def run_interactive_demo():
     finally:
         print("\n🛑 Stopping agent...")
         await agent.stop()
+        await shutdown_browser_pool()
         print("👋 Demo completed!")
 
 
 async def run_quick_demo():
     """Run quick automated demo"""
+    from src.agent.agent import FinAgent
+    from src.agent.browser_automation import shutdown_browser_pool
+    
     print_header()
     print("\n🎬 Running Quick Demo (Automated)")
     print("-" * 40)
@@ -174,8 +203,6 @@ async def run_quick_demo():
             
             status_emoji = "✅" if result['status'] == 'completed' else "⚠️"
             print(f"   {status_emoji} {result['status']}")
-            
-            await asyncio.sleep(1)
         
         print("\n" + "="*70)
         print("   ✅ Quick demo completed!")
@@ -183,10 +210,22 @@ async def run_quick_demo():
     
     finally:
         await agent.stop()
+        await shutdown_browser_pool()
 
 
 def main():
     """Main entry point"""
+    # Load .env before the agent config is imported
+    if os.path.exists('.env'):
+        from dotenv import load_dotenv
+        load_dotenv()
+    
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
+    from src.agent.config import setup_console_logging
+    setup_console_logging()
+    
     if len(sys.argv) > 1 and sys.argv[1] == '--quick':
         asyncio.run(run_quick_demo())
     else:
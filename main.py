@@ -11,16 +11,21 @@ Modes:
 
 import asyncio
 import sys
-import os
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# uvloop is a faster drop-in event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-from src.agent.agent import FinAgent, run_cli
+# Agent and server modules are imported inside each mode so that only the
+# selected mode pays for Playwright, the AI SDKs or FastAPI
 
 
 async def run_demo():
     """Run a demo sequence"""
+    from src.agent.agent import FinAgent
+    from src.agent.browser_automation import shutdown_browser_pool
     
     print("="*60)
     print("🎯 FinAgent Demo - IIT Bombay Techfest Hackathon")
@@ -49,9 +54,6 @@ async def run_demo():
             
             print(f"\n📊 Status: {result['status']}")
             print(f"   Steps: {result['steps_completed']}/{result['total_steps']}")
-            
-            # Wait between commands
-            await asyncio.sleep(2)
         
         print("\n" + "="*60)
         print("✅ Demo completed!")
@@ -59,6 +61,7 @@ async def run_demo():
         
     finally:
         await agent.stop()
+        await shutdown_browser_pool()
 
 
 async def run_server():
@@ -83,12 +86,18 @@ async def run_server():
 
 def main():
     """Main entry point"""
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
+    from src.agent.config import setup_console_logging
+    setup_console_logging()
     
     mode = sys.argv[1] if len(sys.argv) > 1 else "cli"
     
     print(f"\n🤖 FinAgent - Mode: {mode.upper()}\n")
     
     if mode == "cli":
+        from src.agent.agent import run_cli
         asyncio.run(run_cli())
     
     elif mode == "demo":
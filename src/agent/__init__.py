@@ -15,22 +15,75 @@
 __version__ = "1.1.0"
 __author__ = "FinAgent Team"
 
-# Core components
+import importlib
+
+# Config is lightweight and its `config` instance shares a name with the
+# submodule, so it is imported eagerly to keep `src.agent.config` pointing
+# at the Config instance.
 from .config import config, Config, ACTIONS, calculate_backoff_delay
-from .vision import VisionModule, find_element, analyze_page, verify_action
-from .intent_parser import IntentParser, ParsedIntent
-from .browser_automation import BrowserAutomation, ActionResult
-from .conscious_pause import ConciousPause, ApprovalRequest, ApprovalStatus
-from .orchestrator import TaskOrchestrator, Task, TaskStep, TaskStatus
-from .agent import FinAgent
-
-# New improvement modules
-from .audit_logger import AuditLogger, get_audit_logger, init_audit_logger
-from .session_manager import SessionManager, get_session_manager, init_session_manager
-from .element_cache import ElementCache, get_element_cache, init_element_cache
-from .user_errors import UserFriendlyErrors, translate_error, format_error, is_recoverable
-from .transaction_limits import TransactionLimits, get_transaction_limits, check_transaction_limit
-from .metrics import PerformanceMetrics, get_metrics, reset_metrics
+
+# Everything else is imported on first access (PEP 562) so that importing
+# one submodule does not pull in Playwright, the AI SDKs, etc.
+_LAZY_IMPORTS = {
+    # Core components
+    "VisionModule": ".vision",
+    "find_element": ".vision",
+    "analyze_page": ".vision",
+    "verify_action": ".vision",
+    "IntentParser": ".intent_parser",
+    "ParsedIntent": ".intent_parser",
+    "IntentCache": ".intent_cache",
+    "get_intent_cache": ".intent_cache",
+    "init_intent_cache": ".intent_cache",
+    "BrowserAutomation": ".browser_automation",
+    "ActionResult": ".browser_automation",
+    "TabPool": ".browser_automation",
+    "get_shared_browser": ".browser_automation",
+    "shutdown_browser_pool": ".browser_automation",
+    "ConciousPause": ".conscious_pause",
+    "ApprovalRequest": ".conscious_pause",
+    "ApprovalStatus": ".conscious_pause",
+    "TaskOrchestrator": ".orchestrator",
+    "Task": ".orchestrator",
+    "TaskStep": ".orchestrator",
+    "TaskStatus": ".orchestrator",
+    "FinAgent": ".agent",
+    
+    # New improvement modules
+    "AuditLogger": ".audit_logger",
+    "get_audit_logger": ".audit_logger",
+    "init_audit_logger": ".audit_logger",
+    "SessionManager": ".session_manager",
+    "get_session_manager": ".session_manager",
+    "init_session_manager": ".session_manager",
+    "ElementCache": ".element_cache",
+    "get_element_cache": ".element_cache",
+    "init_element_cache": ".element_cache",
+    "UserFriendlyErrors": ".user_errors",
+    "translate_error": ".user_errors",
+    "format_error": ".user_errors",
+    "is_recoverable": ".user_errors",
+    "TransactionLimits": ".transaction_limits",
+    "get_transaction_limits": ".transaction_limits",
+    "check_transaction_limit": ".transaction_limits",
+    "PerformanceMetrics": ".metrics",
+    "get_metrics": ".metrics",
+    "reset_metrics": ".metrics",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Config
@@ -40,7 +93,8 @@ __all__ = [
     "FinAgent",
     "VisionModule", "find_element", "analyze_page", "verify_action",
     "IntentParser", "ParsedIntent",
-    "BrowserAutomation", "ActionResult",
+    "IntentCache", "get_intent_cache", "init_intent_cache",
+    "BrowserAutomation", "ActionResult", "TabPool", "get_shared_browser", "shutdown_browser_pool",
     "ConciousPause", "ApprovalRequest", "ApprovalStatus",
     "TaskOrchestrator", "Task", "TaskStep", "TaskStatus",
     
@@ -13,12 +13,18 @@ The central coordinator that brings together:
 """
 
 import asyncio
-from typing import Dict, Any, Optional, Callable, Awaitable
-from datetime import datetime
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
+from datetime import datetime, timedelta, timezone
 
-from .config import config, Config
+from .config import config, Config, READ_ONLY_ACTIONS, setup_console_logging
 from .intent_parser import IntentParser, ParsedIntent
-from .browser_automation import BrowserAutomation, ActionResult
+from .browser_automation import BrowserAutomation, ActionResult, shutdown_browser_pool
 from .conscious_pause import ConciousPause, ApprovalRequest, ApprovalStatus
 from .orchestrator import TaskOrchestrator, Task, TaskStatus
 
@@ -30,6 +36,23 @@ from .transaction_limits import get_transaction_limits, check_transaction_limit
 from .user_errors import translate_error, format_error
 
 
+logger = logging.getLogger("finagent.agent")
+
+_UTC = timezone.utc
+
+
+# Result cache for read-only commands (e.g. repeated balance checks)
+EXEC_CACHE_TTL = 30.0  # seconds
+EXEC_CACHE_SIZE = 128
+
+# Status updates queued within this window are sent to the UI as one message
+STATUS_BATCH_WINDOW = 0.05  # seconds
+STEP_STATUS_TEMPLATE = "Step {step_id}/{total}: {message}"
+
+# Money-moving actions checked against transaction limits
+LIMITED_ACTIONS = frozenset({"pay_bill", "fund_transfer", "buy_gold"})
+
+
 class FinAgent:
     """
     AI-powered Financial Automation Agent
@@ -62,20 +85,30 @@ class FinAgent:
         
         # State
         self.is_running = False
-        self.session_start = None
-        self.command_history = []
+        self.session_start = None  # Wall-clock time, for display
+        self._session_start_mono: Optional[float] = None  # For durations
+        self.command_history = deque(maxlen=self.config.command_history_size)
+        self.commands_executed = 0
+        
+        # Normalized command -> (cached_at, result) for read-only intents
+        self._exec_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
         
         # Callbacks for UI integration
         self.on_status_update: Optional[Callable[[str], Awaitable[None]]] = None
         self.on_screenshot: Optional[Callable[[str], Awaitable[None]]] = None
         self.on_approval_request: Optional[Callable[[ApprovalRequest], Awaitable[bool]]] = None
         self.on_task_update: Optional[Callable[[Task], Awaitable[None]]] = None
+        
+        # Status updates are queued and coalesced by a background flusher
+        self._status_queue: asyncio.Queue = asyncio.Queue()
+        self._status_flusher: Optional[asyncio.Task] = None
+        self._status_pending: List[str] = []  # Taken off the queue, not yet sent
     
     async def start(self):
         """Initialize and start the agent"""
         
-        print("🚀 Starting FinAgent...")
-        print(f"🌐 Target bank URL: {self.config.bank_url}")
+        logger.info("🚀 Starting FinAgent...")
+        logger.info(f"🌐 Target bank URL: {self.config.bank_url}")
         
         # Log session start
         self.audit_logger.log(
@@ -89,7 +122,7 @@ class FinAgent:
         
         # Try to restore session (cookies, login state)
         if self.session_manager.is_logged_in():
-            print("📂 Found previous session, attempting to restore...")
+            logger.info("📂 Found previous session, attempting to restore...")
             if self.browser.context:
                 await self.session_manager.restore_cookies_to_browser(self.browser.context)
         
@@ -108,35 +141,43 @@ class FinAgent:
         self.orchestrator.on_approval_needed = self._on_approval_needed
         self.orchestrator.on_task_complete = self._on_task_complete
         
+        # Result screenshots are only worth capturing when a UI is listening
+        self.browser.capture_screenshots = self.on_screenshot is not None
+        
         # Navigate to bank
-        print(f"🌐 Navigating to: {self.config.bank_url}")
+        logger.info(f"🌐 Navigating to: {self.config.bank_url}")
         nav_result = await self.browser.navigate()
-        print(f"📍 Navigation result: {nav_result.message}")
+        logger.info(f"📍 Navigation result: {nav_result.message}")
         
         # Send initial screenshot to UI
         if self.on_screenshot:
             try:
                 screenshot = await self.browser.take_screenshot()
                 await self.on_screenshot(screenshot)
-                print("📸 Initial screenshot sent")
+                logger.info("📸 Initial screenshot sent")
             except Exception as e:
-                print(f"⚠️ Failed to send initial screenshot: {e}")
+                logger.warning(f"⚠️ Failed to send initial screenshot: {e}")
         
         # Start auto-save for session
         await self.session_manager.start_auto_save()
         
+        # Start coalescing status updates for the UI
+        if self._status_flusher is None:
+            self._status_flusher = asyncio.create_task(self._flush_status_loop())
+        
         self.is_running = True
-        self.session_start = datetime.now()
+        self.session_start = datetime.now(_UTC)
+        self._session_start_mono = time.monotonic()
         
-        print("✅ FinAgent ready!")
-        print(f"🌐 Connected to: {self.config.bank_url}")
+        logger.info("✅ FinAgent ready!")
+        logger.info(f"🌐 Connected to: {self.config.bank_url}")
         
         return self
     
     async def stop(self):
         """Stop the agent and cleanup"""
         
-        print("\n🛑 Stopping FinAgent...")
+        logger.info("🛑 Stopping FinAgent...")
         
         # Save session state before stopping
         if self.browser.context:
@@ -145,27 +186,32 @@ class FinAgent:
         # Stop auto-save
         await self.session_manager.stop_auto_save()
         
+        # Stop the status flusher, delivering anything still queued
+        await self._stop_status_flusher()
+        
         # Log session end
         self.audit_logger.log(
             action_type=ActionType.SESSION_END,
             details={
-                "commands_executed": len(self.command_history),
-                "session_duration": str(datetime.now() - self.session_start) if self.session_start else "0"
+                "commands_executed": self.commands_executed,
+                "session_duration": str(timedelta(seconds=self._session_uptime())) if self._session_start_mono else "0"
             },
             risk_level="low"
         )
+        self.audit_logger.flush()
         
         # Export session log
         try:
             log_path = self.audit_logger.export_session_log()
-            print(f"📝 Session log saved: {log_path}")
+            logger.info(f"📝 Session log saved: {log_path}")
         except Exception as e:
-            print(f"⚠️ Failed to export session log: {e}")
+            logger.warning(f"⚠️ Failed to export session log: {e}")
         
         await self.browser.stop()
         self.is_running = False
+        self._exec_cache.clear()
         
-        print("👋 FinAgent stopped")
+        logger.info("👋 FinAgent stopped")
     
     async def execute(self, command: str) -> Dict[str, Any]:
         """
@@ -181,7 +227,7 @@ class FinAgent:
         if not self.is_running:
             return {"error": "Agent not running. Call start() first."}
         
-        print(f"\n📝 Command: {command}")
+        logger.info(f"📝 Command: {command}")
         
         # Start tracking metrics
         self.metrics.start_command(command, action="parsing")
@@ -190,16 +236,30 @@ class FinAgent:
         self.audit_logger.log_command(command)
         
         # Parse intent first to check transaction limits
-        intent = self.intent_parser.parse(command)
+        intent = await self.intent_parser.parse_async(command)
+        
+        # Serve repeated read-only queries from cache
+        cache_key = " ".join(command.lower().split())
+        if intent.action in READ_ONLY_ACTIONS:
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                logger.info("📦 Using cached result")
+                self._record_command(command, intent.to_dict())
+                self.metrics.complete_command(success=True)
+                # Callers may modify the result, so the cached entry is never handed out
+                return copy.deepcopy(cached)
+        else:
+            # Any other action may change balances or page state
+            self._exec_cache.clear()
         
         # Check transaction limits if applicable
         amount = intent.parameters.get("amount", 0)
-        if amount > 0 and intent.action in ["pay_bill", "fund_transfer", "buy_gold"]:
+        if amount > 0 and intent.action in LIMITED_ACTIONS:
             limit_check = check_transaction_limit(intent.action, amount)
             
             if not limit_check.allowed:
                 error_msg = self.transaction_limits.format_limit_message(limit_check)
-                print(f"⚠️ {error_msg}")
+                logger.warning(f"⚠️ {error_msg}")
                 
                 self.audit_logger.log_error(
                     error_type="transaction_limit",
@@ -221,21 +281,13 @@ class FinAgent:
             
             # Warn about 2FA if required
             if limit_check.requires_2fa:
-                print("⚠️ High-value transaction: Additional verification may be required")
+                logger.warning("⚠️ High-value transaction: Additional verification may be required")
         
-        # Store in history
-        self.command_history.append({
-            "command": command,
-            "timestamp": datetime.now().isoformat(),
-            "intent": intent.to_dict()
-        })
-        
-        # Save to session manager
-        self.session_manager.add_command(command, intent.to_dict())
+        self._record_command(command, intent.to_dict())
         
         try:
             # Process through orchestrator
-            task = await self.orchestrator.process_command(command)
+            task = await self.orchestrator.process_command(command, intent=intent)
             
             # Record successful transaction if applicable
             if task.status == TaskStatus.COMPLETED and amount > 0:
@@ -247,7 +299,7 @@ class FinAgent:
                 error=None if task.status == TaskStatus.COMPLETED else "Task failed"
             )
             
-            return {
+            result = {
                 "task_id": task.id,
                 "status": task.status.value,
                 "command": command,
@@ -256,6 +308,11 @@ class FinAgent:
                 "result": task.to_dict()
             }
             
+            if intent.action in READ_ONLY_ACTIONS and task.status == TaskStatus.COMPLETED:
+                self._cache_result(cache_key, result)
+            
+            return result
+            
         except Exception as e:
             # Translate error for user
             user_error = translate_error(str(e))
@@ -275,20 +332,37 @@ class FinAgent:
                 "suggestion": user_error.suggestion,
                 "technical_details": str(e)
             }
+        
+        finally:
+            # Read-only results cached while this task ran may predate its changes
+            if intent.action not in READ_ONLY_ACTIONS:
+                self._exec_cache.clear()
+    
+    def _record_command(self, command: str, intent_dict: Dict[str, Any]):
+        """Add a command to the history and the session"""
+        # Bounded history (oldest entries drop off); the timestamp is formatted only when history is read
+        self.command_history.append({
+            "command": command,
+            "timestamp": datetime.now(_UTC),
+            "intent": intent_dict
+        })
+        self.commands_executed += 1
+        
+        # Save to session manager
+        self.session_manager.add_command(command, intent_dict)
     
     async def get_status(self) -> Dict[str, Any]:
         """Get current agent status with comprehensive metrics"""
         
-        page_state = await self.browser.get_page_state() if self.is_running else {}
-        
         return {
             "is_running": self.is_running,
             "session_start": self.session_start.isoformat() if self.session_start else None,
-            "commands_executed": len(self.command_history),
+            "uptime_s": round(self._session_uptime(), 1),
+            "commands_executed": self.commands_executed,
             "is_logged_in": self.browser.is_logged_in if self.is_running else False,
-            "current_url": page_state.get("url", ""),
+            "current_url": self.browser.current_url if self.is_running else "",
             "pending_approvals": self.conscious_pause.get_pending_requests(),
-            "recent_history": self.command_history[-5:],
+            "recent_history": self.get_command_history(limit=5),
             
             # New metrics
             "performance": self.metrics.get_summary(),
@@ -300,6 +374,19 @@ class FinAgent:
             }
         }
     
+    def _session_uptime(self) -> float:
+        """Seconds since start(), immune to wall-clock adjustments"""
+        if self._session_start_mono is None:
+            return 0.0
+        return time.monotonic() - self._session_start_mono
+    
+    def get_command_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get command history (most recent last) with JSON-ready timestamps"""
+        history = self.command_history
+        if limit is not None:
+            history = islice(history, max(0, len(history) - limit), None)
+        return [{**entry, "timestamp": entry["timestamp"].isoformat()} for entry in history]
+    
     async def approve(self, request_id: str) -> bool:
         """Approve a pending action"""
         result = self.conscious_pause.approve(request_id)
@@ -354,38 +441,122 @@ class FinAgent:
     
     async def get_balance(self) -> str:
         """Quick command to check balance"""
+        # Fast path: read it off the dashboard without parsing/planning a task
+        if self.is_running:
+            balance = await self.browser.read_balance()
+            if balance:
+                return balance
+        
         result = await self.execute("check my balance")
         if result.get("status") == "completed":
             return result.get("result", {}).get("steps", [{}])[-1].get("result", {}).get("data", {}).get("balance", "Unknown")
         return "Unable to fetch balance"
     
+    # Result cache
+    
+    def _get_cached_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result if present and not expired"""
+        entry = self._exec_cache.get(key)
+        if entry is None:
+            return None
+        
+        cached_at, result = entry
+        if time.monotonic() - cached_at > EXEC_CACHE_TTL:
+            del self._exec_cache[key]
+            return None
+        
+        self._exec_cache.move_to_end(key)
+        return result
+    
+    def _cache_result(self, key: str, result: Dict[str, Any]):
+        """Store a result, evicting the least recently used entries"""
+        self._exec_cache[key] = (time.monotonic(), result)
+        self._exec_cache.move_to_end(key)
+        while len(self._exec_cache) > EXEC_CACHE_SIZE:
+            self._exec_cache.popitem(last=False)
+    
     # Internal callbacks
     
+    def _queue_status(self, message: str):
+        """Queue a status update for the UI without waiting on delivery"""
+        if self.on_status_update:
+            self._status_queue.put_nowait(message)
+    
+    async def _send_status_batch(self, batch: List[str]):
+        """Deliver queued status updates as a single newline-joined message"""
+        try:
+            await self.on_status_update("\n".join(batch))
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to send status update: {e}")
+    
+    def _drain_status_queue(self, batch: List[str]) -> List[str]:
+        """Move everything currently queued into batch"""
+        while not self._status_queue.empty():
+            batch.append(self._status_queue.get_nowait())
+        return batch
+    
+    async def _flush_status(self):
+        """Send everything pending or queued right away"""
+        batch = self._drain_status_queue(self._status_pending)
+        self._status_pending = []
+        if batch and self.on_status_update:
+            await self._send_status_batch(batch)
+    
+    async def _flush_status_loop(self):
+        """Background loop that coalesces status updates"""
+        while True:
+            # Held on self so a cancel during the batch window does not lose it
+            self._status_pending.append(await self._status_queue.get())
+            await asyncio.sleep(STATUS_BATCH_WINDOW)
+            await self._flush_status()
+    
+    async def _stop_status_flusher(self):
+        """Cancel the flusher and send any updates still pending or queued"""
+        if self._status_flusher:
+            self._status_flusher.cancel()
+            try:
+                await self._status_flusher
+            except asyncio.CancelledError:
+                pass
+            self._status_flusher = None
+        
+        await self._flush_status()
+    
     async def _on_step_complete(self, task: Task, step):
         """Called when a step completes"""
-        if self.on_status_update:
-            await self.on_status_update(
-                f"Step {step.id}/{len(task.steps)}: {step.result.message if step.result else 'Done'}"
-            )
+        # Nothing to format or send when no UI is attached (CLI/demo modes)
+        if not (self.on_status_update or self.on_screenshot or self.on_task_update):
+            return
         
+        if self.on_status_update:
+            self._queue_status(STEP_STATUS_TEMPLATE.format(
+                step_id=step.id,
+                total=len(task.steps),
+                message=step.result.message if step.result else "Done"
+            ))
+        
+        # Independent UI pushes - send them concurrently
+        updates = []
         if self.on_screenshot and step.result and step.result.screenshot:
-            await self.on_screenshot(step.result.screenshot)
-        
+            updates.append(self.on_screenshot(step.result.screenshot))
         if self.on_task_update:
-            await self.on_task_update(task)
+            updates.append(self.on_task_update(task))
+        
+        if updates:
+            await asyncio.gather(*updates)
     
     async def _on_approval_needed(self, request: ApprovalRequest):
         """Called when approval is needed"""
         if self.on_status_update:
-            await self.on_status_update(
-                f"⚠️ Approval needed: {request.description}"
-            )
+            self._queue_status(f"⚠️ Approval needed: {request.description}")
     
     async def _on_task_complete(self, task: Task):
         """Called when task completes"""
         if self.on_status_update:
             status = "✅ Completed" if task.status == TaskStatus.COMPLETED else "❌ Failed"
-            await self.on_status_update(f"Task {task.id}: {status}")
+            self._queue_status(f"Task {task.id}: {status}")
+            # The UI should see the last step and completion lines before the final task state
+            await self._flush_status()
         
         if self.on_task_update:
             await self.on_task_update(task)
@@ -393,9 +564,40 @@ class FinAgent:
 
 # ===== CLI Interface =====
 
+async def ainput(prompt: str = "") -> str:
+    """
+    input() that waits in a background thread so the event loop keeps running
+    
+    Uses a daemon thread rather than the default executor so a prompt left
+    pending on Ctrl+C does not hold up interpreter shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def _resolve(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def _read():
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(_resolve, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(_resolve, future.set_result, line)
+    
+    threading.Thread(target=_read, daemon=True).start()
+    return await future
+
+
 async def run_cli():
     """Run agent in CLI mode for testing"""
     
+    # Run tasks eagerly until their first suspension (Python 3.12+)
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    
     agent = FinAgent()
     
     try:
@@ -412,9 +614,17 @@ async def run_cli():
         print("  - 'buy gold worth 2000'")
         print("="*60 + "\n")
         
+        # prompt_toolkit reads keys on the event loop itself (with line
+        # editing and history); fall back to the threaded reader without it
+        try:
+            from prompt_toolkit import PromptSession
+            read_command = PromptSession().prompt_async
+        except ImportError:
+            read_command = ainput
+        
         while True:
             try:
-                command = input("\n🤖 Enter command: ").strip()
+                command = (await read_command("\n🤖 Enter command: ")).strip()
                 
                 if not command:
                     continue
@@ -426,14 +636,23 @@ async def run_cli():
                 
                 print(f"\n📊 Result: {result['status']}")
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 break
             except Exception as e:
                 print(f"Error: {e}")
     
     finally:
         await agent.stop()
+        await shutdown_browser_pool()
 
 
 if __name__ == "__main__":
+    # uvloop is a faster drop-in event loop (not available on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
+    setup_console_logging()
     asyncio.run(run_cli())
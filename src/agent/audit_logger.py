@@ -10,14 +10,30 @@ Provides structured logging for all FinAgent operations:
 - Performance metrics
 """
 
+import os
+import sys
+import queue
+import random
+import atexit
 import logging
-import json
-from datetime import datetime
+import logging.handlers
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from collections import defaultdict, deque
 from pathlib import Path
 from typing import Any, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
+import orjson
+
+from .config import config
+
+
+logger = logging.getLogger("finagent.audit")
+
 
 class LogLevel(Enum):
     """Log severity levels"""
@@ -47,10 +63,42 @@ class ActionType(Enum):
     TRANSACTION_FAILED = "transaction_failed"
 
 
-@dataclass
+_UTC = timezone.utc
+
+
+# Action types recorded at each AUDIT_LEVEL (failures are always recorded)
+_SESSION_ACTIONS = {ActionType.SESSION_START, ActionType.SESSION_END}
+_MUTATION_ACTIONS = _SESSION_ACTIONS | {
+    ActionType.APPROVAL_REQUESTED,
+    ActionType.APPROVAL_GRANTED,
+    ActionType.APPROVAL_DENIED,
+    ActionType.TRANSACTION_START,
+    ActionType.TRANSACTION_COMPLETE,
+    ActionType.TRANSACTION_FAILED,
+}
+AUDIT_LEVELS = {
+    "all": frozenset(ActionType),
+    "writes_only": frozenset(ActionType) - {
+        ActionType.INTENT_PARSED,
+        ActionType.BROWSER_ACTION,
+        ActionType.VISION_ANALYSIS,
+        ActionType.API_CALL,
+    },
+    "mutations_only": frozenset(_MUTATION_ACTIONS),
+    "failures_only": frozenset(_SESSION_ACTIONS),
+}
+
+# Enum .value goes through a descriptor; look the strings up directly
+_ACTION_STR = {action: action.value for action in ActionType}
+
+# Written even when the audit queue is full (as are failed entries of any type)
+_NEVER_DROPPED = frozenset(_ACTION_STR[action] for action in _MUTATION_ACTIONS)
+
+
+@dataclass(slots=True)
 class AuditEntry:
     """Single audit log entry"""
-    timestamp: str
+    timestamp_ns: int  # time.time_ns(), formatted only on export
     action_type: str
     risk_level: str
     details: Dict[str, Any]
@@ -60,11 +108,172 @@ class AuditEntry:
     success: bool = True
     error_message: Optional[str] = None
     
+    @property
+    def iso_timestamp(self) -> str:
+        """Entry time as an ISO 8601 string (UTC)"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=_UTC).isoformat()
+    
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["timestamp"] = self.iso_timestamp
+        del data["timestamp_ns"]
+        return data
+    
+    def to_json_bytes(self) -> bytes:
+        return orjson.dumps(self.to_dict(), default=str, option=orjson.OPT_NON_STR_KEYS)
     
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return self.to_json_bytes().decode()
+
+
+class AuditBuffer:
+    """
+    Background writer for audit entries
+    
+    put() only enqueues the entry; a daemon thread serializes queued
+    entries and appends them to the file with one os.write() per batch,
+    flushing every flush_interval seconds or once max_size are pending.
+    When max_pending entries are waiting, mutation and failure entries
+    are written synchronously and other entries are dropped.
+    
+    The file rotates at midnight like TimedRotatingFileHandler: the old
+    file becomes <name>.YYYY-MM-DD and only backup_count of those are kept.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        max_size: int = 500,
+        flush_interval: float = 5.0,
+        backup_count: int = 30
+    ):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.backup_count = backup_count
+        self.max_pending = max_size * 4
+        self.dropped = 0
+        self._overflowing = False  # Drop warning already logged for the current backlog
+        
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._fd = None
+        
+        # An existing file rotates at the midnight after it was last written
+        started = self.path.stat().st_mtime if self.path.exists() else time.time()
+        self._open(started)
+        
+        self._thread = threading.Thread(target=self._flush_loop, name="audit-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def put(self, entry: "AuditEntry"):
+        """Queue an entry for writing (blocks on disk only for kept entries once the queue is full)"""
+        if self._closed:
+            self._drop(entry, "audit log is closed")
+            return
+        
+        pending = self._queue.qsize()
+        if pending >= self.max_pending:
+            if entry.action_type in _NEVER_DROPPED or not entry.success:
+                # Write it, and the backlog ahead of it, before returning
+                self._queue.put_nowait(entry)
+                self.flush()
+            else:
+                self._drop(entry, f"{pending} entries pending")
+            return
+        
+        self._overflowing = False
+        self._queue.put_nowait(entry)
+        if pending + 1 >= self.max_size:
+            self._wakeup.set()
+    
+    def _drop(self, entry: "AuditEntry", reason: str):
+        """Count a dropped entry, warning once per backlog"""
+        self.dropped += 1
+        if not self._overflowing:
+            self._overflowing = True
+            logger.warning(f"⚠️ Dropping audit entries ({reason}), first: {entry.action_type}")
+    
+    @staticmethod
+    def _next_midnight(timestamp: float) -> float:
+        """Local midnight following the given time"""
+        day = datetime.fromtimestamp(timestamp).date() + timedelta(days=1)
+        return datetime(day.year, day.month, day.day).timestamp()
+    
+    def _open(self, timestamp: float):
+        """Open the current file and schedule its rollover"""
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._rollover_at = self._next_midnight(timestamp)
+    
+    def _rollover(self):
+        """Move the current file aside under its date and start a new one"""
+        os.close(self._fd)
+        
+        day = datetime.fromtimestamp(self._rollover_at - 1).strftime("%Y-%m-%d")
+        backup = self.path.with_name(f"{self.path.name}.{day}")
+        if not backup.exists():
+            os.replace(self.path, backup)
+        
+        backups = sorted(self.path.parent.glob(f"{self.path.name}.*"))
+        for old in backups[:-self.backup_count]:
+            old.unlink(missing_ok=True)
+        
+        self._open(time.time())
+    
+    def _flush_loop(self):
+        """Flush thread: write pending entries on interval or size trigger"""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+    
+    def flush(self):
+        """Write all pending entries to disk"""
+        with self._lock:
+            if self._fd is None:
+                return
+            
+            while True:
+                lines = []
+                try:
+                    while len(lines) < self.max_size:
+                        lines.append(self._queue.get_nowait().to_json_bytes())
+                except queue.Empty:
+                    pass
+                
+                if not lines:
+                    break
+                
+                if time.time() >= self._rollover_at:
+                    self._rollover()
+                
+                lines.append(b"")  # Trailing newline
+                data = memoryview(b"\n".join(lines))
+                try:
+                    while data:
+                        data = data[os.write(self._fd, data):]
+                except OSError as e:
+                    self.dropped += len(lines)
+                    logger.warning(f"⚠️ Failed to write audit log: {e}")
+    
+    def close(self):
+        """Drain pending entries and close the file"""
+        if self._closed:
+            return
+        
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        
+        self.flush()
+        with self._lock:
+            os.close(self._fd)
+            self._fd = None
+        atexit.unregister(self.close)
 
 
 class AuditLogger:
@@ -73,61 +282,80 @@ class AuditLogger:
     
     Features:
     - Structured JSON logging
-    - File and console output
+    - Buffered, background file output
     - Session tracking
     - Performance timing
     - Risk level classification
     """
     
-    def __init__(self, log_dir: str = "logs", session_id: Optional[str] = None):
+    def __init__(
+        self,
+        log_dir: str = "logs",
+        session_id: Optional[str] = None,
+        audit_level: Optional[str] = None,
+        sample_rates: Optional[Dict[str, float]] = None
+    ):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
         self.session_id = session_id or self._generate_session_id()
+        # Entries carry the short id; SESSION_START records the full one
+        self.short_session_id = sys.intern(self.session_id[:8])
         
         # Setup loggers
         self._setup_audit_logger()
         self._setup_performance_logger()
         
+        # Which successful entries to record
+        audit_level = audit_level or config.audit_level
+        if audit_level not in AUDIT_LEVELS:
+            raise ValueError(f"Unknown audit level: {audit_level}")
+        self._allowed = AUDIT_LEVELS[audit_level]
+        
+        # Sampled action types (rate < 1); every other allowed type is always kept
+        rates = config.audit_sample_rates if sample_rates is None else sample_rates
+        self._sample_rates = {
+            action: rate for action in ActionType
+            if (rate := rates.get(action.value, 1.0)) < 1.0
+        }
+        
         # In-memory log buffer for recent entries
-        self.recent_entries: list[AuditEntry] = []
         self.max_recent = 1000
+        self.recent_entries: deque[AuditEntry] = deque(maxlen=self.max_recent)
         
-        print(f"📝 Audit Logger initialized (Session: {self.session_id[:8]}...)")
+        # Running session totals (not limited to the recent entries)
+        self.total_entries = 0
+        self.success_count = 0
+        self.action_counts: Dict[str, int] = defaultdict(int)
+        self._first_entry: Optional[AuditEntry] = None
+        
+        logger.info(f"📝 Audit Logger initialized (Session: {self.short_session_id}...)")
     
     def _generate_session_id(self) -> str:
         """Generate unique session ID"""
-        import uuid
-        return str(uuid.uuid4())
+        return uuid.uuid4().hex
     
     def _setup_audit_logger(self):
-        """Setup main audit logger"""
-        self.audit_logger = logging.getLogger("finagent.audit")
-        self.audit_logger.setLevel(logging.INFO)
-        self.audit_logger.handlers = []  # Clear existing handlers
-        
-        # File handler - JSON format
-        audit_file = self.log_dir / f"audit_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(audit_file, encoding='utf-8')
-        file_handler.setFormatter(logging.Formatter('%(message)s'))
-        self.audit_logger.addHandler(file_handler)
-        
-        # Console handler for important events
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.WARNING)
-        console_handler.setFormatter(logging.Formatter(
-            '%(asctime)s | %(levelname)s | %(message)s'
-        ))
-        self.audit_logger.addHandler(console_handler)
+        """Setup main audit trail (JSON lines, written in the background)"""
+        self.audit_buffer = AuditBuffer(self.log_dir / "audit.log")
     
     def _setup_performance_logger(self):
         """Setup performance metrics logger"""
         self.perf_logger = logging.getLogger("finagent.performance")
         self.perf_logger.setLevel(logging.INFO)
+        for handler in self.perf_logger.handlers:
+            handler.close()  # Release the previous instance's file
         self.perf_logger.handlers = []
+        self.perf_logger.propagate = False
         
-        perf_file = self.log_dir / f"performance_{datetime.now().strftime('%Y%m%d')}.log"
-        handler = logging.FileHandler(perf_file, encoding='utf-8')
+        # Rotates to performance.log.YYYY-MM-DD at midnight
+        handler = logging.handlers.TimedRotatingFileHandler(
+            self.log_dir / "performance.log",
+            when="midnight",
+            backupCount=30,
+            encoding='utf-8',
+            delay=True
+        )
         handler.setFormatter(logging.Formatter('%(message)s'))
         self.perf_logger.addHandler(handler)
     
@@ -140,10 +368,13 @@ class AuditLogger:
         error_message: Optional[str] = None,
         execution_time_ms: Optional[float] = None,
         user_id: Optional[str] = None
-    ) -> AuditEntry:
+    ) -> Optional[AuditEntry]:
         """
         Log an auditable action
         
+        Successful entries may be skipped (returning None) per the audit
+        level and sample rates; failures are always recorded.
+        
         Args:
             action_type: Type of action being logged
             details: Action-specific details
@@ -153,25 +384,37 @@ class AuditLogger:
             execution_time_ms: Time taken in milliseconds
             user_id: User identifier if available
         """
+        if success:
+            if action_type not in self._allowed:
+                return None
+            rate = self._sample_rates.get(action_type)
+            if rate is not None and random.random() >= rate:
+                return None
+        
         entry = AuditEntry(
-            timestamp=datetime.now().isoformat(),
-            action_type=action_type.value,
+            timestamp_ns=time.time_ns(),
+            action_type=_ACTION_STR[action_type],
             risk_level=risk_level,
             details=details,
             user_id=user_id,
-            session_id=self.session_id,
+            session_id=self.session_id if action_type is ActionType.SESSION_START else self.short_session_id,
             execution_time_ms=execution_time_ms,
             success=success,
             error_message=error_message
         )
         
-        # Log to file
-        self.audit_logger.info(entry.to_json())
+        # Queue for the background file writer
+        self.audit_buffer.put(entry)
         
         # Store in memory
         self.recent_entries.append(entry)
-        if len(self.recent_entries) > self.max_recent:
-            self.recent_entries.pop(0)
+        
+        # Update session totals
+        self.total_entries += 1
+        self.success_count += success
+        self.action_counts[entry.action_type] += 1
+        if self._first_entry is None:
+            self._first_entry = entry
         
         return entry
     
@@ -301,27 +544,28 @@ class AuditLogger:
             success=status == "success"
         )
     
+    def flush(self):
+        """Write all queued audit entries to disk"""
+        self.audit_buffer.flush()
+    
+    def close(self):
+        """Flush and close the audit trail"""
+        self.audit_buffer.close()
+    
     def get_session_summary(self) -> Dict[str, Any]:
         """Get summary of current session"""
-        if not self.recent_entries:
+        if not self.total_entries:
             return {"session_id": self.session_id, "entries": 0}
         
-        success_count = sum(1 for e in self.recent_entries if e.success)
-        error_count = len(self.recent_entries) - success_count
-        
-        action_counts = {}
-        for entry in self.recent_entries:
-            action_counts[entry.action_type] = action_counts.get(entry.action_type, 0) + 1
-        
         return {
             "session_id": self.session_id,
-            "total_entries": len(self.recent_entries),
-            "success_count": success_count,
-            "error_count": error_count,
-            "success_rate": success_count / len(self.recent_entries) if self.recent_entries else 0,
-            "action_breakdown": action_counts,
-            "start_time": self.recent_entries[0].timestamp if self.recent_entries else None,
-            "last_activity": self.recent_entries[-1].timestamp if self.recent_entries else None
+            "total_entries": self.total_entries,
+            "success_count": self.success_count,
+            "error_count": self.total_entries - self.success_count,
+            "success_rate": self.success_count / self.total_entries,
+            "action_breakdown": dict(self.action_counts),
+            "start_time": self._first_entry.iso_timestamp,
+            "last_activity": self.recent_entries[-1].iso_timestamp
         }
     
     def get_recent_errors(self, limit: int = 10) -> list[AuditEntry]:
@@ -332,17 +576,22 @@ class AuditLogger:
     def export_session_log(self, filepath: Optional[str] = None) -> str:
         """Export session log to JSON file"""
         if filepath is None:
-            filepath = self.log_dir / f"session_{self.session_id[:8]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filepath = self.log_dir / f"session_{self.short_session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
-        export_data = {
+        header = orjson.dumps({
             "session_id": self.session_id,
-            "export_time": datetime.now().isoformat(),
-            "summary": self.get_session_summary(),
-            "entries": [e.to_dict() for e in self.recent_entries]
-        }
+            "export_time": datetime.now(_UTC).isoformat(),
+            "summary": self.get_session_summary()
+        }, default=str, option=orjson.OPT_NON_STR_KEYS)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2)
+        # Stream entries one per line instead of building the whole document
+        with open(filepath, 'wb') as f:
+            f.write(header[:-1])
+            f.write(b',"entries":[')
+            for i, entry in enumerate(self.recent_entries):
+                f.write(b',\n' if i else b'\n')
+                f.write(entry.to_json_bytes())
+            f.write(b'\n]}\n')
         
         return str(filepath)
 
@@ -9,16 +9,199 @@ This module provides the "Digital Hand" functionality:
 - Action execution on the banking website
 """
 
+import os
+import re
 import asyncio
 import base64
+import time
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+from playwright.async_api import async_playwright, Browser, Page, BrowserContext, Locator, CDPSession
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 
 from .config import config, ACTIONS
 
+try:
+    # SIMD base64 that encodes straight into a str
+    from pybase64 import b64encode_as_string
+except ImportError:
+    def b64encode_as_string(data: bytes) -> str:
+        return base64.b64encode(data).decode('ascii')
 
-@dataclass
+
+# Playwright browser types accepted in config.browser_type (anything else launches chromium)
+BROWSER_TYPES = ("chromium", "firefox", "webkit")
+
+# Optimized Chromium launch args for faster startup and performance
+CHROMIUM_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',  # Faster startup
+    '--disable-setuid-sandbox',
+    '--disable-extensions',
+    '--disable-gpu',  # Faster in headless
+    '--disable-software-rasterizer',
+    # Pooled tabs run side by side; keep background ones at full speed
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding'
+]
+
+# goto() waits for DOMContentLoaded at most this long before carrying on
+NAVIGATION_TIMEOUT_MS = 8000
+
+# Default for clicks, fills and waits; calls pass timeout= only to wait less
+ACTION_TIMEOUT_MS = 5000
+
+# Requests aborted in every context; stylesheets stay since layout drives vision and .active checks
+BLOCKED_RESOURCES = "**/*.{png,jpg,jpeg,gif,webp,ico,svg,woff,woff2,ttf,otf,mp4,webm,mp3}"
+BLOCKED_HOSTS = re.compile(r"google-analytics\.com|googletagmanager\.com|doubleclick\.net|segment\.io|hotjar\.com")
+
+# Screenshots are JPEG at this quality (a fraction of the PNG size)
+SCREENSHOT_QUALITY = 60
+
+# CDP captures are downscaled by this factor (768x480 for the 1280x800 viewport); vision
+# coordinates are scaled back up before clicking
+SCREENSHOT_SCALE = 0.6
+
+# An unchanged page reuses its last screenshot for at most this long (covers CSS transitions)
+SCREENSHOT_REUSE_SECONDS = 2.0
+
+# Installed in every context: bumps window.__finagentDomVersion on any DOM change or user input
+DOM_VERSION_INIT_JS = """(() => {
+    window.__finagentDomVersion = 0;
+    const bump = () => { window.__finagentDomVersion++; };
+    new MutationObserver(bump).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    for (const type of ['input', 'change', 'scroll']) addEventListener(type, bump, true);
+})()"""
+
+# Error results give up on their screenshot after this many seconds (a dead page would stall them)
+FAILURE_SCREENSHOT_TIMEOUT = 1.0
+
+# Cheap page fingerprint compared before taking a screenshot
+DOM_FINGERPRINT_JS = "() => location.href + '|' + window.__finagentDomVersion"
+
+# Reads the first five .transaction-item rows (skipping ones without title or amount)
+RECENT_TRANSACTIONS_JS = """() => Array.from(document.querySelectorAll('.transaction-item'))
+    .slice(0, 5)
+    .map(item => {
+        const title = item.querySelector('.txn-title');
+        const amount = item.querySelector('.txn-amount');
+        const date = item.querySelector('.txn-date');
+        if (!title || !amount) return null;
+        return {title: title.textContent, amount: amount.textContent, date: date ? date.textContent : ''};
+    })
+    .filter(Boolean)"""
+
+# Resolves on the first DOM change that shows an outcome, or with null after timeout ms:
+# {kind: 'success' | 'error', message} from the result modal (Modal.jsx), or {kind: 'dashboard'} once it is back
+CONFIRM_OUTCOME_JS = """(timeout) => new Promise(resolve => {
+    const outcome = () => {
+        const modal = document.querySelector('.modal.active .modal-content.success, .modal.active .modal-content.error');
+        if (modal) {
+            const message = modal.querySelector('p');
+            return {
+                kind: modal.classList.contains('error') ? 'error' : 'success',
+                message: message ? message.textContent.trim() : ''
+            };
+        }
+        if (document.querySelector('.dashboard-container')) return {kind: 'dashboard', message: ''};
+        return null;
+    };
+    const finish = (result) => { observer.disconnect(); clearTimeout(timer); resolve(result); };
+    const observer = new MutationObserver(() => { const result = outcome(); if (result) finish(result); });
+    const timer = setTimeout(() => finish(null), timeout);
+    const current = outcome();
+    if (current) return finish(current);
+    observer.observe(document.body, {
+        subtree: true, childList: true, characterData: true, attributes: true, attributeFilter: ['class']
+    });
+})"""
+
+# The bank shows its loading overlay for 2 s (handleConfirmAction in App.jsx) before the result modal;
+# this is the upper bound for that, the wait normally ends as soon as the modal renders
+CONFIRM_OUTCOME_TIMEOUT_MS = 4000
+
+# Balance text if the dashboard selector matches, else null: ([dashboard, balance]) selectors
+DASHBOARD_BALANCE_JS = """([dashboard, balance]) => {
+    const element = document.querySelector(dashboard) && document.querySelector(balance);
+    return element ? element.textContent : null;
+}"""
+
+# Truthy once any of the given selectors matches an element
+ANY_PRESENT_JS = "(selectors) => selectors.some(selector => document.querySelector(selector))"
+
+# Clicks the first visible element for the first selector that has one; returns whether anything was clicked
+CLICK_FIRST_VISIBLE_JS = """(selectors) => {
+    for (const selector of selectors) {
+        const element = Array.from(document.querySelectorAll(selector)).find(el => el.offsetParent !== null);
+        if (element) {
+            element.click();
+            return true;
+        }
+    }
+    return false;
+}"""
+
+# Sets several inputs in one call, firing the input/change events fill() would; returns names not found.
+# The prototype's value setter is used because React ignores a plain .value write on controlled inputs
+FILL_MANY_JS = """(fields) => fields
+    .filter(([name, selector, value]) => {
+        const el = document.querySelector(selector);
+        if (!el) return true;
+        Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        return false;
+    })
+    .map(([name]) => name)"""
+
+# Value of the biller option named exactly (else starting with) the given name, case-insensitive; null if not listed
+BILLER_OPTION_JS = """([select, name]) => {
+    const wanted = name.trim().toLowerCase();
+    const options = Array.from(document.querySelectorAll(`${select} option`)).filter(option => option.value);
+    const match = options.find(option => option.value.toLowerCase() === wanted)
+        || options.find(option => option.value.toLowerCase().startsWith(wanted));
+    return match ? match.value : null;
+}"""
+
+# Selectors on the bank site, bound to Locators once per page in start()
+SELECTORS = {
+    "username": "#username",
+    "password": "#password",
+    "login_button": "#login-btn",
+    "dashboard_page": "#dashboard-page.active",
+    "dashboard_container": ".dashboard-container",
+    "balance": "#account-balance",
+    "pay_bills_link": "[data-action='pay-bills']",
+    "pay_bills_page": "#pay-bills-page.active",
+    "biller_category": ".biller-cat",
+    "biller_select": "#biller-select",
+    "consumer_number": "#consumer-number",
+    "bill_amount": "#bill-amount",
+    "pay_bill_button": "#pay-bill-btn",
+    "fund_transfer_link": "[data-action='fund-transfer']",
+    "fund_transfer_page": "#fund-transfer-page.active",
+    "recipient_name": "#recipient-name",
+    "recipient_account": "#recipient-account",
+    "recipient_ifsc": "#recipient-ifsc",
+    "transfer_amount": "#transfer-amount",
+    "transfer_button": "#transfer-btn",
+    "buy_gold_link": "[data-action='buy-gold']",
+    "buy_gold_page": "#buy-gold-page.active",
+    "gold_grams_tab": "[data-type='grams']",
+    "gold_grams": "#gold-grams",
+    "gold_amount": "#gold-amount",
+    "buy_gold_button": "#buy-gold-btn",
+    "confirm_modal": ".modal.active .modal-content.confirm",
+    "confirm_proceed": "#confirm-proceed-btn",
+    "confirm_cancel": ".modal-content.confirm .btn-outline",
+    "modal_ok": ".modal-content.success .btn-primary, .modal-content.error .btn-primary",
+    "back_button": ".btn-back, [id$='-back']",
+    "home_link": ".nav-brand, .logo-icon-small",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ActionResult:
     """Result of a browser action"""
     success: bool
@@ -29,23 +212,34 @@ class ActionResult:
     vision_used: bool = False  # Track if vision was used
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        """Serializable form (without the screenshot); data is omitted when there is none"""
+        result = {
             "success": self.success,
             "action": self.action,
             "message": self.message,
-            "data": self.data,
             "vision_used": self.vision_used
         }
+        if self.data is not None:
+            result["data"] = self.data
+        return result
 
 
 class BrowserAutomation:
     """Browser automation using Playwright with Vision AI support"""
     
     def __init__(self):
-        self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._loc: Dict[str, Locator] = {}
+        self._pool: Optional["TabPool"] = None
+        self._last_shot: Optional[Tuple[str, float, str]] = None  # (fingerprint, taken_at, b64)
+        self._cdp: Optional[CDPSession] = None  # Chromium only, for screenshots
+        self._screenshot_scale = 1.0  # Image pixels per page pixel of the last capture
+        self._vision_warmup: Optional[asyncio.Task] = None
+        self._located_in: Optional[str] = None  # Screenshot the _locations answers belong to
+        self._locations: Dict[Tuple[str, str], Any] = {}
+        self.capture_screenshots = True  # Attach screenshots to successful results
         self.is_logged_in = False
         self.vision = None  # Vision module for AI-based element detection
         self._init_vision()
@@ -59,72 +253,112 @@ class BrowserAutomation:
             except Exception as e:
                 print(f"⚠️ Vision module not available: {e}")
     
+    @classmethod
+    def from_pool(cls, pool: "TabPool") -> "BrowserAutomation":
+        """Create an instance whose context is taken from (and returned to) a TabPool"""
+        automation = cls()
+        automation._pool = pool
+        return automation
+    
     async def start(self):
-        """Initialize browser with optimized settings"""
-        self.playwright = await async_playwright().start()
+        """Open an isolated context and page on the shared browser"""
+        # Warm the vision API connection while the browser side is set up
+        if self.vision and self.vision.client and self._vision_warmup is None:
+            self._vision_warmup = asyncio.create_task(self.vision.warmup())
         
-        browser_types = {
-            "chromium": self.playwright.chromium,
-            "firefox": self.playwright.firefox,
-            "webkit": self.playwright.webkit
-        }
+        if self._pool:
+            self.context, self.page = await self._pool.acquire()
+            self.browser = self.context.browser
+        else:
+            self.browser = await get_shared_browser()
+            self.context, self.page = await _open_context(self.browser)
         
-        browser_launcher = browser_types.get(config.browser_type, self.playwright.chromium)
-        
-        # Optimized launch args for faster startup and performance
-        launch_args = []
-        if config.browser_type == "chromium":
-            launch_args = [
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',  # Faster startup
-                '--disable-setuid-sandbox',
-                '--disable-extensions',
-                '--disable-gpu',  # Faster in headless
-                '--disable-software-rasterizer'
-            ]
-        
-        self.browser = await browser_launcher.launch(
-            headless=config.headless,
-            slow_mo=config.slow_mo,
-            args=launch_args
-        )
+        self._bind_locators()
         
-        self.context = await self.browser.new_context(
-            viewport={"width": 1280, "height": 800},
-            # Optimize network and caching for speed
-            bypass_csp=True,
-            ignore_https_errors=True
+        if self.vision and self.vision.client:
+            print("👁️ Vision AI enabled for element detection")
+    
+    def _bind_locators(self):
+        """Create reusable Locators for SELECTORS on the current page"""
+        # .first keeps page.click()/fill() semantics for selectors that match several elements
+        self._loc = {name: self.page.locator(selector).first for name, selector in SELECTORS.items()}
+    
+    async def _fill_many(self, fields: Dict[str, str]):
+        """Fill several SELECTORS inputs in one round-trip (fill() for any not rendered yet)"""
+        if not fields:
+            return
+        
+        missing = await self.page.evaluate(
+            FILL_MANY_JS,
+            [[name, SELECTORS[name], value] for name, value in fields.items()]
         )
+        for name in missing:
+            await self._loc[name].fill(fields[name])
+    
+    async def _select_biller(self, biller: str):
+        """Choose a biller in the required biller dropdown, switching category if it is not listed"""
+        args = [SELECTORS["biller_select"], biller]
+        value = await self.page.evaluate(BILLER_OPTION_JS, args)
         
-        # Block unnecessary resources for faster page loads
-        await self.context.route("**/*.{png,jpg,jpeg,gif,svg,woff,woff2}", lambda route: route.abort())
+        # The dropdown only lists the selected category's billers
+        if value is None:
+            categories = self.page.locator(SELECTORS["biller_category"])
+            for index in range(await categories.count()):
+                await categories.nth(index).click()
+                value = await self.page.evaluate(BILLER_OPTION_JS, args)
+                if value is not None:
+                    break
         
-        self.page = await self.context.new_page()
+        if value is None:
+            raise ValueError(f"Biller '{biller}' is not listed")
         
-        print(f"🌐 Browser started ({config.browser_type}) - Optimized mode")
-        if self.vision and self.vision.client:
-            print("👁️ Vision AI enabled for element detection")
+        await self._loc["biller_select"].select_option(value=value)
+    
+    async def _save_browser_state(self):
+        """Persist cookies/localStorage to config.browser_state_file (if set)"""
+        if not config.browser_state_file:
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(config.browser_state_file) or ".", exist_ok=True)
+            await self.context.storage_state(path=config.browser_state_file)
+        except Exception as e:
+            print(f"⚠️ Failed to save browser state: {e}")
     
     async def stop(self):
-        """Close browser"""
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
-        print("🌐 Browser closed")
+        """Close this instance's context (the shared browser stays up)"""
+        # Don't leave the warmup pending; a later start() warms up again
+        if self._vision_warmup:
+            if not self._vision_warmup.done():
+                self._vision_warmup.cancel()
+            self._vision_warmup = None
+        
+        if self._cdp:
+            try:
+                await self._cdp.detach()
+            except Exception:
+                pass
+            self._cdp = None
+        self._last_shot = None
+        
+        if self._pool and self.context:
+            await self._pool.release(self.context)
+        elif self.context:
+            await self.context.close()
+        self.context = None
+        self.page = None
+        print("🌐 Browser context closed")
     
     async def navigate(self, url: str = None) -> ActionResult:
         """Navigate to URL"""
         url = url or config.bank_url
         print(f"🌐 Browser navigating to: {url}")
         try:
-            # Optimized timeout: faster for development, reasonable for production
-            timeout = 45000 if config.headless else 30000
-            await self.page.goto(url, wait_until="domcontentloaded", timeout=timeout)
-            
-            # Reduced wait time for faster response
-            await asyncio.sleep(0.5)
+            # Only wait for the DOM; later selector waits are the real readiness check
+            try:
+                await self.page.goto(url, wait_until="domcontentloaded")
+            except PlaywrightTimeoutError:
+                print(f"⚠️ Page still loading after {NAVIGATION_TIMEOUT_MS} ms, continuing")
             
             return ActionResult(
                 success=True,
@@ -140,18 +374,76 @@ class BrowserAutomation:
             )
     
     async def take_screenshot(self) -> str:
-        """Take screenshot and return base64 encoded"""
-        screenshot_bytes = await self.page.screenshot()
-        return base64.b64encode(screenshot_bytes).decode('utf-8')
+        """Take a JPEG screenshot and return it base64 encoded (reused while the page is unchanged)"""
+        try:
+            fingerprint = await self.page.evaluate(DOM_FINGERPRINT_JS)
+        except Exception:
+            fingerprint = None  # e.g. mid-navigation, always capture
+        
+        last = self._last_shot
+        if fingerprint and last and last[0] == fingerprint and time.monotonic() - last[1] < SCREENSHOT_REUSE_SECONDS:
+            return last[2]
+        
+        screenshot = await self._capture_jpeg()
+        self._last_shot = (fingerprint, time.monotonic(), screenshot) if fingerprint else None
+        return screenshot
+    
+    async def _capture_jpeg(self) -> str:
+        """Base64 JPEG of the viewport (straight from CDP on Chromium, which already returns base64)"""
+        if self._cdp is None and config.browser_type == "chromium":
+            try:
+                self._cdp = await self.context.new_cdp_session(self.page)
+            except Exception as e:
+                print(f"⚠️ CDP session not available, using page.screenshot(): {e}")
+        
+        viewport = self.page.viewport_size
+        if self._cdp and viewport:
+            try:
+                result = await self._cdp.send("Page.captureScreenshot", {
+                    "format": "jpeg",
+                    "quality": SCREENSHOT_QUALITY,
+                    # Chromium scales while encoding, fewer bytes to move and for vision to read
+                    "clip": {"x": 0, "y": 0, **viewport, "scale": SCREENSHOT_SCALE}
+                })
+                self._screenshot_scale = SCREENSHOT_SCALE
+                return result["data"]
+            except Exception:
+                self._cdp = None  # Session went away, reopen on the next capture
+        
+        screenshot_bytes = await self.page.screenshot(type="jpeg", quality=SCREENSHOT_QUALITY)
+        self._screenshot_scale = 1.0
+        return b64encode_as_string(screenshot_bytes)
+    
+    def _page_point(self, location) -> Tuple[int, int]:
+        """Page coordinates for a vision location found in the last screenshot"""
+        return round(location.x / self._screenshot_scale), round(location.y / self._screenshot_scale)
+    
+    async def _result_screenshot(self) -> Optional[str]:
+        """Screenshot for a successful result (None when nobody displays them)"""
+        if not self.capture_screenshots:
+            return None
+        return await self.take_screenshot()
+    
+    async def _failure_screenshot(self) -> Optional[str]:
+        """Best-effort screenshot for an error result (None if the page is gone or unresponsive)"""
+        if not self.page or self.page.is_closed():
+            return None
+        
+        try:
+            return await asyncio.wait_for(self.take_screenshot(), FAILURE_SCREENSHOT_TIMEOUT)
+        except Exception:
+            return None
     
     # ===== VISION-BASED ACTIONS (Core Innovation) =====
     
-    async def click_with_vision(self, element_description: str, element_type: str = "button") -> ActionResult:
+    async def click_with_vision(self, element_description: str, element_type: str = "button",
+                                include_screenshot: bool = True) -> ActionResult:
         """
         Click an element using AI Vision to find it
         
         This is the CORE INNOVATION - the agent "sees" the UI like a human
         and clicks based on visual understanding, not brittle selectors.
+        Pass include_screenshot=False when only success matters (skips the after-click capture).
         """
         if not self.vision or not self.vision.client:
             return ActionResult(
@@ -166,7 +458,7 @@ class BrowserAutomation:
             
             # Use AI to find element
             print(f"   👁️ Looking for: {element_description}")
-            location = await self.vision.find_element(screenshot, element_description, element_type)
+            location = await self._find_element(screenshot, element_description, element_type)
             
             if not location.found:
                 return ActionResult(
@@ -178,16 +470,17 @@ class BrowserAutomation:
                 )
             
             print(f"   👁️ Found at ({location.x}, {location.y}) with {location.confidence:.0%} confidence")
-             with faster timing
-            await self.page.mouse.click(location.x, location.y)
-            await asyncio.sleep(0.3)  # Reduced from 0.5s for faster location.y)
-            await asyncio.sleep(0.5)  # Wait for UI response
+            
+            # Click at the location with faster timing
+            await self.page.mouse.click(*self._page_point(location))
+            if include_screenshot and self.capture_screenshots:
+                await asyncio.sleep(0.3)  # Let the UI react before capturing it
             
             return ActionResult(
                 success=True,
                 action="vision_click",
                 message=f"Clicked {element_description} at ({location.x}, {location.y})",
-                screenshot=await self.take_screenshot(),
+                screenshot=await self._result_screenshot() if include_screenshot else None,
                 vision_used=True,
                 data={
                     "element": element_description,
@@ -204,9 +497,12 @@ class BrowserAutomation:
                 vision_used=True
             )
     
-    async def type_with_vision(self, field_description: str, text: str) -> ActionResult:
+    async def type_with_vision(self, field_description: str, text: str,
+                               include_screenshot: bool = True) -> ActionResult:
         """
         Type into a field using AI Vision to find it
+        
+        Pass include_screenshot=False when only success matters (skips the after-typing capture).
         """
         if not self.vision or not self.vision.client:
             return ActionResult(
@@ -219,7 +515,7 @@ class BrowserAutomation:
             screenshot = await self.take_screenshot()
             
             print(f"   👁️ Looking for input: {field_description}")
-            location = await self.vision.find_element(screenshot, field_description, "input")
+            location = await self._find_element(screenshot, field_description, "input")
             
             if not location.found:
                 return ActionResult(
@@ -233,15 +529,14 @@ class BrowserAutomation:
             print(f"   👁️ Found input at ({location.x}, {location.y})")
             
             # Click to focus, then type
-            await self.page.mouse.click(location.x, location.y)
-            await asyncio.sleep(0.2)
+            await self.page.mouse.click(*self._page_point(location))
             await self.page.keyboard.type(text)
             
             return ActionResult(
                 success=True,
                 action="vision_type",
                 message=f"Typed into {field_description}",
-                screenshot=await self.take_screenshot(),
+                screenshot=await self._result_screenshot() if include_screenshot else None,
                 vision_used=True
             )
         
@@ -253,6 +548,56 @@ class BrowserAutomation:
                 vision_used=True
             )
     
+    async def _find_element(self, screenshot: str, description: str, element_type: str):
+        """vision.find_element, answering repeat questions about the same screenshot from memory"""
+        # take_screenshot() hands back the same str object while the page is unchanged
+        if screenshot is not self._located_in:
+            self._located_in, self._locations = screenshot, {}
+        
+        key = (description, element_type)
+        if key not in self._locations:
+            self._locations[key] = await self.vision.find_element(screenshot, description, element_type)
+        return self._locations[key]
+    
+    async def _type_fields_with_vision(self, fields: Dict[str, Tuple[str, str]]) -> Dict[str, str]:
+        """
+        Locate several input fields with one vision call and type into each
+        
+        Args:
+            fields: SELECTORS name -> (field description, text)
+        
+        Returns:
+            Fields vision could not fill (SELECTORS name -> text), for _fill_many()
+        """
+        if not self.vision or not self.vision.client:
+            return {name: text for name, (_, text) in fields.items()}
+        
+        descriptions = [description for description, _ in fields.values()]
+        print(f"   👁️ Looking for inputs: {', '.join(descriptions)}")
+        try:
+            screenshot = await self.take_screenshot()
+            locations = await self.vision.find_elements(screenshot, descriptions, "input")
+        except Exception as e:
+            print(f"   ⚠️ Vision lookup failed, using selector fallback: {e}")
+            return {name: text for name, (_, text) in fields.items()}
+        
+        fallback = {}
+        for (name, (description, text)), location in zip(fields.items(), locations):
+            if not location.found:
+                print(f"   ⚠️ Vision could not find {description}, using selector fallback...")
+                fallback[name] = text
+                continue
+            
+            print(f"   👁️ Found {description} at ({location.x}, {location.y})")
+            try:
+                await self.page.mouse.click(*self._page_point(location))
+                await self.page.keyboard.type(text)
+            except Exception as e:
+                print(f"   ⚠️ Vision typing failed for {description}: {e}")
+                fallback[name] = text
+        
+        return fallback
+    
     async def analyze_current_page(self) -> Dict[str, Any]:
         """
         Use Vision AI to understand current page state
@@ -306,12 +651,13 @@ class BrowserAutomation:
         if fallback_selector:
             try:
                 await self.page.click(fallback_selector)
-                await asyncio.sleep(0.3)
+                if self.capture_screenshots:
+                    await asyncio.sleep(0.3)  # Let the UI react before capturing it
                 return ActionResult(
                     success=True,
                     action="selector_click",
                     message=f"Clicked {element_description} via selector",
-                    screenshot=await self.take_screenshot(),
+                    screenshot=await self._result_screenshot(),
                     vision_used=False
                 )
             except Exception as e:
@@ -327,13 +673,19 @@ class BrowserAutomation:
             message=f"Could not click {element_description}"
         )
     
+    @property
+    def current_url(self) -> str:
+        """Current page URL (tracked locally by Playwright, no browser round-trip)"""
+        return self.page.url if self.page else ""
+    
     async def get_page_state(self) -> Dict[str, Any]:
         """Get current page state for AI analysis"""
+        title, screenshot = await asyncio.gather(self.page.title(), self.take_screenshot())
         return {
             "url": self.page.url,
-            "title": await self.page.title(),
+            "title": title,
             "is_logged_in": self.is_logged_in,
-            "screenshot": await self.take_screenshot()
+            "screenshot": screenshot
         }
     
     # ===== Banking Actions =====
@@ -345,12 +697,28 @@ class BrowserAutomation:
             if "localhost:8080" not in self.page.url:
                 await self.navigate()
             
-            # Wait for page to fully load
-            await asyncio.sleep(0.5)
+            # Wait until either the login form or the dashboard is rendered
+            try:
+                await self.page.wait_for_function(
+                    ANY_PRESENT_JS, arg=[SELECTORS["username"], SELECTORS["dashboard_page"]], timeout=3000
+                )
+            except PlaywrightTimeoutError:
+                print("⚠️ Login page not recognised yet, continuing")
             
-            # Check if already logged in using vision
-            screenshot = await self.take_screenshot()
-            if self.vision and self.vision.client:
+            # A restored browser state can land straight on the dashboard
+            if await self._loc["dashboard_page"].count():
+                self.is_logged_in = True
+                return ActionResult(
+                    success=True,
+                    action="login",
+                    message="Already logged in",
+                    screenshot=await self._result_screenshot(),
+                    data={"username": username}
+                )
+            
+            # Check if already logged in using vision (a visible login form already says no)
+            if self.vision and self.vision.client and not await self._loc["username"].is_visible():
+                screenshot = await self.take_screenshot()
                 page_analysis = await self.vision.analyze_page(screenshot)
                 if "dashboard" in page_analysis.page_type.lower() or "logged" in page_analysis.current_state.lower():
                     self.is_logged_in = True
@@ -363,49 +731,37 @@ class BrowserAutomation:
                         data={"username": username}
                     )
             
-            # Use vision to fill username field
+            # Use vision to find and fill both fields
             print("   👁️ Using Vision AI to login...")
-            username_result = await self.type_with_vision("username input field", username)
-            if not username_result.success:
-                print("   ⚠️ Vision failed for username, trying selector fallback...")
-                await self.page.fill("#username", username)
-            
-            await asyncio.sleep(0.2)
-            
-            # Use vision to fill password field
-            password_result = await self.type_with_vision("password input field", password)
-            if not password_result.success:
-                print("   ⚠️ Vision failed for password, trying selector fallback...")
-                await self.page.fill("#password", password)
-            
-            await asyncio.sleep(0.3)
+            fallback = await self._type_fields_with_vision({
+                "username": ("username input field", username),
+                "password": ("password input field", password)
+            })
+            await self._fill_many(fallback)
             
             # Use vision to click login button
-            login_result = await self.click_with_vision("login button", "button")
+            login_result = await self.click_with_vision("login button", "button", include_screenshot=False)
             if not login_result.success:
                 print("   ⚠️ Vision failed for login button, trying selector fallback...")
-                await self.page.click("#login-btn")
+                await self._loc["login_button"].click()
             
             # Wait for dashboard to become active
-            await asyncio.sleep(1.5)  # Give JavaScript time to process
-            
-            # Verify dashboard is now visible
-            for _ in range(5):
-                dashboard_active = await self.page.query_selector("#dashboard-page.active")
-                if dashboard_active:
-                    break
-                await asyncio.sleep(0.3)
+            await self._wait_until("dashboard_page", 3000)
             
             self.is_logged_in = True
             
-            # Get balance
-            balance_text = await self.page.text_content("#account-balance")
+            # Read balance, capture the dashboard and save the login together
+            balance_text, screenshot, _ = await asyncio.gather(
+                self._loc["balance"].text_content(),
+                self._result_screenshot(),
+                self._save_browser_state()
+            )
             
             return ActionResult(
                 success=True,
                 action="login",
                 message=f"Logged in successfully as {username}",
-                screenshot=await self.take_screenshot(),
+                screenshot=screenshot,
                 data={"username": username, "balance": balance_text}
             )
         
@@ -414,7 +770,7 @@ class BrowserAutomation:
                 success=False,
                 action="login",
                 message=f"Login failed: {str(e)}",
-                screenshot=await self.take_screenshot()
+                screenshot=await self._failure_screenshot()
             )
     
     async def check_balance(self) -> ActionResult:
@@ -423,13 +779,16 @@ class BrowserAutomation:
             if not self.is_logged_in:
                 return ActionResult(False, "check_balance", "Please login first")
             
-            balance_text = await self.page.text_content("#account-balance")
+            balance_text, screenshot = await asyncio.gather(
+                self._loc["balance"].text_content(),
+                self._result_screenshot()
+            )
             
             return ActionResult(
                 success=True,
                 action="check_balance",
                 message=f"Current balance: {balance_text}",
-                screenshot=await self.take_screenshot(),
+                screenshot=screenshot,
                 data={"balance": balance_text}
             )
         
@@ -440,38 +799,75 @@ class BrowserAutomation:
                 message=f"Failed to check balance: {str(e)}"
             )
     
+    async def read_balance(self) -> Optional[str]:
+        """Read the balance straight from the dashboard if it is showing"""
+        if not self.is_logged_in:
+            return None
+        
+        try:
+            # Dashboard check and balance read in one round-trip
+            return await self.page.evaluate(
+                DASHBOARD_BALANCE_JS, [SELECTORS["dashboard_page"], SELECTORS["balance"]]
+            )
+        except Exception:
+            return None
+    
+    async def _wait_until(self, name: str, timeout: float) -> bool:
+        """Wait up to timeout ms for a SELECTORS element to be in the DOM (False instead of raising)"""
+        try:
+            await self._loc[name].wait_for(state="attached", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+    
+    async def _already_on(self, page_key: str, label: str) -> Optional[ActionResult]:
+        """Result for a section navigation that can be skipped (None if the section is not open)"""
+        if not await self._loc[page_key].count():
+            return None
+        
+        return ActionResult(
+            success=True,
+            action="navigate",
+            message=f"Already on {label} page",
+            screenshot=await self._result_screenshot()
+        )
+    
     async def navigate_to_pay_bills(self) -> ActionResult:
         """Navigate to bill payment page using Vision AI"""
-        try:            # Ensure we're on the dashboard first
-            dashboard = await self.page.query_selector("#dashboard-page.active")
+        try:
+            # Nothing to do if the section is already open
+            current = await self._already_on("pay_bills_page", "Pay Bills")
+            if current:
+                return current
+            
+            # Ensure we're on the dashboard first
+            dashboard = await self._loc["dashboard_page"].count()
             if not dashboard:
                 print("   Not on dashboard, navigating there first...")
                 await self.go_back_to_dashboard()
-                await asyncio.sleep(0.5)
             
             # Use vision to click Pay Bills button
-            result = await self.click_with_vision("Pay Bills button", "button")
+            result = await self.click_with_vision("Pay Bills button", "button", include_screenshot=False)
             if result.success:
-                await asyncio.sleep(0.5)
+                await self._wait_until("pay_bills_page", 3000)
                 return ActionResult(
                     success=True,
                     action="navigate",
                     message="Navigated to Pay Bills page using Vision",
-                    screenshot=await self.take_screenshot(),
+                    screenshot=await self._result_screenshot(),
                     vision_used=True
                 )
             
             # Fallback to selector
             print("   ⚠️ Vision failed, using selector fallback...")
-            await self.page.wait_for_selector("[data-action='pay-bills']", timeout=5000)
-            await self.page.click("[data-action='pay-bills']")
-            await self.page.wait_for_selector("#pay-bills-page.active, #bill-pay-form", timeout=3000)
+            await self._loc["pay_bills_link"].click()
+            await self._loc["pay_bills_page"].wait_for(timeout=3000)
             
             return ActionResult(
                 success=True,
                 action="navigate",
                 message="Navigated to Pay Bills page",
-                screenshot=await self.take_screenshot()
+                screenshot=await self._result_screenshot()
             )
         except Exception as e:
             return ActionResult(False, "navigate", f"Navigation failed: {str(e)}")
@@ -480,50 +876,36 @@ class BrowserAutomation:
         """Pay a utility bill using Vision AI"""
         try:
             # First ensure we're on the pay bills page
-            pay_bills_page = await self.page.query_selector("#pay-bills-page.active")
+            pay_bills_page = await self._loc["pay_bills_page"].count()
             if not pay_bills_page:
                 await self.navigate_to_pay_bills()
-                await asyncio.sleep(0.5)
             
-            print("   👁️ Using Vision AI to fill bill payment form...")
+            # The biller dropdown is required; vision does not handle selects
+            await self._select_biller(biller)
             
-            # Use vision to fill consumer number
-            consumer_result = await self.type_with_vision("consumer number input field", consumer_number)
-            if not consumer_result.success:
-                print("   ⚠️ Vision failed, using selector fallback...")
-                await self.page.fill("#consumer-number", consumer_number)
-            
-            await asyncio.sleep(0.3)
-            
-            # Use vision to fill amount
-            amount_result = await self.type_with_vision("bill amount input field", str(int(amount)))
-            if not amount_result.success:
-                print("   ⚠️ Vision failed, using selector fallback...")
-                await self.page.fill("#bill-amount", str(int(amount)))
+            print("   👁️ Using Vision AI to fill bill payment form...")
             
-            await asyncio.sleep(0.5)
+            # One vision call for both fields; the ones it misses are set together before submitting
+            fallback = await self._type_fields_with_vision({
+                "consumer_number": ("consumer number input field", consumer_number),
+                "bill_amount": ("bill amount input field", str(int(amount)))
+            })
+            await self._fill_many(fallback)
             
             # Use vision to click pay button
-            pay_result = await self.click_with_vision("Pay Bill button", "button")
+            pay_result = await self.click_with_vision("Pay Bill button", "button", include_screenshot=False)
             if not pay_result.success:
                 print("   ⚠️ Vision failed, using selector fallback...")
-                await self.page.click("#pay-bill-btn")
+                await self._loc["pay_bill_button"].click()
             
             # Wait for confirmation modal
-            await asyncio.sleep(1)
-            
-            # Check if modal appeared
-            for _ in range(5):
-                modal = await self.page.query_selector("#confirm-modal.active")
-                if modal:
-                    break
-                await asyncio.sleep(0.3)
+            await self._wait_until("confirm_modal", 2500)
             
             return ActionResult(
                 success=True,
                 action="pay_bill",
                 message=f"Bill payment prepared: ₹{amount} to {biller}",
-                screenshot=await self.take_screenshot(),
+                screenshot=await self._result_screenshot(),
                 data={
                     "biller": biller,
                     "consumer_number": consumer_number,
@@ -537,107 +919,83 @@ class BrowserAutomation:
                 success=False,
                 action="pay_bill",
                 message=f"Bill payment failed: {str(e)}",
-                screenshot=await self.take_screenshot()
+                screenshot=await self._failure_screenshot()
             )
     
     async def navigate_to_fund_transfer(self) -> ActionResult:
         """Navigate to fund transfer page using Vision AI"""
         try:
+            # Nothing to do if the section is already open
+            current = await self._already_on("fund_transfer_page", "Fund Transfer")
+            if current:
+                return current
+            
             # Check if we're on the dashboard
-            dashboard = await self.page.query_selector("#dashboard-page.active")
+            dashboard = await self._loc["dashboard_page"].count()
             if not dashboard:
                 print("   Dashboard not active, navigating back...")
                 await self.go_back_to_dashboard()
-                await asyncio.sleep(0.5)
             
             # Use vision to click Fund Transfer button
             print("   👁️ Using Vision AI to navigate to Fund Transfer...")
-            result = await self.click_with_vision("Fund Transfer button or Transfer Money button", "button")
+            result = await self.click_with_vision("Fund Transfer button or Transfer Money button", "button", include_screenshot=False)
             if result.success:
-                await asyncio.sleep(0.5)
+                await self._wait_until("fund_transfer_page", 3000)
                 return ActionResult(
                     success=True,
                     action="navigate",
                     message="Navigated to Fund Transfer page using Vision",
-                    screenshot=await self.take_screenshot(),
+                    screenshot=await self._result_screenshot(),
                     vision_used=True
                 )
             
             # Fallback to selector
             print("   ⚠️ Vision failed, using selector fallback...")
-            await self.page.wait_for_selector("[data-action='fund-transfer']", timeout=5000, state="visible")
-            await self.page.click("[data-action='fund-transfer']")
-            await self.page.wait_for_selector("#fund-transfer-page.active, #transfer-form", timeout=3000)
+            await self._loc["fund_transfer_link"].click()
+            await self._loc["fund_transfer_page"].wait_for(timeout=3000)
             
             return ActionResult(
                 success=True,
                 action="navigate",
                 message="Navigated to Fund Transfer page",
-                screenshot=await self.take_screenshot()
+                screenshot=await self._result_screenshot()
             )
         except Exception as e:
-            screenshot = await self.take_screenshot()
+            screenshot = await self._failure_screenshot()
             return ActionResult(False, "navigate", f"Navigation failed: {str(e)}", screenshot=screenshot)
     
     async def fund_transfer(self, recipient: str = "Mom", account: str = "9876543210", ifsc: str = "JFIN0001234", amount: float = 1000) -> ActionResult:
         """Transfer money to another account using Vision AI"""
         try:
             # First ensure we're on the transfer page
-            transfer_page = await self.page.query_selector("#fund-transfer-page.active")
+            transfer_page = await self._loc["fund_transfer_page"].count()
             if not transfer_page:
                 await self.navigate_to_fund_transfer()
-                await asyncio.sleep(0.5)
             
             print("   👁️ Using Vision AI to fill transfer form...")
             
-            # Use vision to fill recipient name
-            result = await self.type_with_vision("recipient name field", recipient)
-            if not result.success:
-                await self.page.fill("#recipient-name", recipient)
-            
-            await asyncio.sleep(0.2)
-            
-            # Use vision to fill account number
-            result = await self.type_with_vision("account number field", account)
-            if not result.success:
-                await self.page.fill("#recipient-account", account)
-            
-            await asyncio.sleep(0.2)
-            
-            # Use vision to fill IFSC code
-            result = await self.type_with_vision("IFSC code field", ifsc)
-            if not result.success:
-                await self.page.fill("#recipient-ifsc", ifsc)
-            
-            await asyncio.sleep(0.2)
-            
-            # Use vision to fill amount
-            result = await self.type_with_vision("transfer amount field", str(int(amount)))
-            if not result.success:
-                await self.page.fill("#transfer-amount", str(int(amount)))
-            
-            await asyncio.sleep(0.5)
+            # One vision call for all four fields; the ones it misses are set together before submitting
+            fallback = await self._type_fields_with_vision({
+                "recipient_name": ("recipient name field", recipient),
+                "recipient_account": ("account number field", account),
+                "recipient_ifsc": ("IFSC code field", ifsc),
+                "transfer_amount": ("transfer amount field", str(int(amount)))
+            })
+            await self._fill_many(fallback)
             
             # Use vision to click transfer button
-            result = await self.click_with_vision("Transfer button", "button")
+            result = await self.click_with_vision("Transfer button", "button", include_screenshot=False)
             if not result.success:
-                await self.page.click("#transfer-btn")
+                await self._loc["transfer_button"].click()
             
             # Wait for confirmation modal
-            await asyncio.sleep(1)
-            
-            # Check if modal appeared
-            for _ in range(5):
-                modal = await self.page.query_selector("#confirm-modal.active")
-                if modal:
-                    break
-                await asyncio.sleep(0.3)
+            await self._wait_until("confirm_modal", 2500)
             
             return ActionResult(
                 success=True,
                 action="fund_transfer",
                 message=f"Transfer prepared: ₹{amount} to {recipient}",
-                screenshot=await self.take_screenshot(),
+                screenshot=await self._result_screenshot(),
                 data={
                     "recipient": recipient,
                     "account": account,
@@ -651,7 +1009,7 @@ class BrowserAutomation:
                 success=False,
                 action="fund_transfer",
                 message=f"Transfer failed: {str(e)}",
-                screenshot=await self.take_screenshot()
+                screenshot=await self._failure_screenshot()
             )
     
     async def select_beneficiary(self, name: str) -> ActionResult:
@@ -662,7 +1020,7 @@ class BrowserAutomation:
                 success=True,
                 action="select_beneficiary",
                 message=f"Selected beneficiary: {name}",
-                screenshot=await self.take_screenshot()
+                screenshot=await self._result_screenshot()
             )
         except Exception as e:
             return ActionResult(False, "select_beneficiary", f"Failed: {str(e)}")
@@ -670,104 +1028,98 @@ class BrowserAutomation:
     async def navigate_to_buy_gold(self) -> ActionResult:
         """Navigate to digital gold page using Vision AI"""
         try:
+            # Nothing to do if the section is already open
+            current = await self._already_on("buy_gold_page", "Digital Gold")
+            if current:
+                return current
+            
             # Check if we're on the dashboard first
-            dashboard = await self.page.query_selector("#dashboard-page.active")
+            dashboard = await self._loc["dashboard_page"].count()
             if not dashboard:
                 print("   Dashboard not active, navigating back...")
                 await self.go_back_to_dashboard()
-                await asyncio.sleep(0.5)
             
             # Use vision to click Buy Gold button
             print("   👁️ Using Vision AI to navigate to Buy Gold...")
-            result = await self.click_with_vision("Buy Gold button or Digital Gold button", "button")
+            result = await self.click_with_vision("Buy Gold button or Digital Gold button", "button", include_screenshot=False)
             if result.success:
-                await asyncio.sleep(0.5)
+                await self._wait_until("buy_gold_page", 3000)
                 return ActionResult(
                     success=True,
                     action="navigate",
                     message="Navigated to Digital Gold page using Vision",
-                    screenshot=await self.take_screenshot(),
+                    screenshot=await self._result_screenshot(),
                     vision_used=True
                 )
             
             # Fallback to selector
             print("   ⚠️ Vision failed, using selector fallback...")
-            await self.page.wait_for_selector("[data-action='buy-gold']", timeout=5000, state="visible")
-            await self.page.click("[data-action='buy-gold']")
-            await self.page.wait_for_selector("#buy-gold-page.active, #gold-form", timeout=3000)
+            await self._loc["buy_gold_link"].click()
+            await self._loc["buy_gold_page"].wait_for(timeout=3000)
             
             return ActionResult(
                 success=True,
                 action="navigate",
                 message="Navigated to Digital Gold page",
-                screenshot=await self.take_screenshot()
+                screenshot=await self._result_screenshot()
             )
         except Exception as e:
-            screenshot = await self.take_screenshot()
+            screenshot = await self._failure_screenshot()
             return ActionResult(False, "navigate", f"Navigation failed: {str(e)}", screenshot=screenshot)
     
     async def buy_gold(self, amount: float = None, grams: float = None) -> ActionResult:
         """Buy digital gold using Vision AI"""
         try:
             # First ensure we're on the gold page
-            gold_page = await self.page.query_selector("#buy-gold-page.active")
+            gold_page = await self._loc["buy_gold_page"].count()
             if not gold_page:
                 await self.navigate_to_buy_gold()
-                await asyncio.sleep(0.5)
             
             print("   👁️ Using Vision AI to fill gold purchase form...")
             
             if grams:
                 # Switch to grams mode using vision
-                result = await self.click_with_vision("grams tab or grams option", "button")
+                result = await self.click_with_vision("grams tab or grams option", "button", include_screenshot=False)
                 if not result.success:
-                    await self.page.click("[data-type='grams']")
+                    await self._loc["gold_grams_tab"].click()
                 
-                await asyncio.sleep(0.3)
+                # Vision needs the grams input on screen
+                await self._wait_until("gold_grams", 1000)
                 
                 # Fill grams using vision
-                result = await self.type_with_vision("gold grams input field", str(grams))
+                result = await self.type_with_vision("gold grams input field", str(grams), include_screenshot=False)
                 if not result.success:
-                    await self.page.fill("#gold-grams", str(grams))
+                    await self._loc["gold_grams"].fill(str(grams))
             elif amount:
                 # Fill amount using vision (default mode)
-                result = await self.type_with_vision("gold amount input field", str(int(amount)))
+                result = await self.type_with_vision("gold amount input field", str(int(amount)), include_screenshot=False)
                 if not result.success:
-                    await self.page.fill("#gold-amount", str(int(amount)))
+                    await self._loc["gold_amount"].fill(str(int(amount)))
             else:
                 # Just navigate to the page without filling values
                 return ActionResult(
                     success=True,
                     action="buy_gold",
                     message="Navigated to Digital Gold page. Please specify the amount or grams to purchase.",
-                    screenshot=await self.take_screenshot(),
+                    screenshot=await self._result_screenshot(),
                     data={
                         "awaiting_input": True
                     }
                 )
             
-            await asyncio.sleep(0.5)
-            
             # Use vision to click buy button
-            result = await self.click_with_vision("Buy Gold button or Purchase button", "button")
+            result = await self.click_with_vision("Buy Gold button or Purchase button", "button", include_screenshot=False)
             if not result.success:
-                await self.page.click("#buy-gold-btn")
+                await self._loc["buy_gold_button"].click()
             
             # Wait for confirmation modal
-            await asyncio.sleep(1)
-            
-            # Check if modal appeared
-            for _ in range(5):
-                modal = await self.page.query_selector("#confirm-modal.active")
-                if modal:
-                    break
-                await asyncio.sleep(0.3)
+            await self._wait_until("confirm_modal", 2500)
             
             return ActionResult(
                 success=True,
                 action="buy_gold",
                 message=f"Gold purchase prepared: {'₹' + str(amount) if amount else str(grams) + ' grams'}",
-                screenshot=await self.take_screenshot(),
+                screenshot=await self._result_screenshot(),
                 data={
                     "amount": amount,
                     "grams": grams,
@@ -780,54 +1132,31 @@ class BrowserAutomation:
                 success=False,
                 action="buy_gold",
                 message=f"Gold purchase failed: {str(e)}",
-                screenshot=await self.take_screenshot()
+                screenshot=await self._failure_screenshot()
             )
     
     async def confirm_action(self) -> ActionResult:
         """Confirm the pending action in modal"""
         try:
             print("   Clicking confirm button...")
-            await self.page.click("#confirm-proceed-btn")
-            
-            # Wait for confirm modal to close
-            print("   Waiting for confirm modal to close...")
-            await asyncio.sleep(0.5)
+            await self._loc["confirm_proceed"].click()
             
-            # Wait for loading overlay to appear and disappear (2 second simulation in script.js)
-            print("   Waiting for transaction processing...")
+            # Watched inside the page, so the outcome comes back in the same round-trip that waits for it
+            print("   Waiting for transaction result...")
             try:
-                # Check if loading overlay appears
-                await self.page.wait_for_selector("#loading-overlay", state="visible", timeout=1000)
-                print("   Loading overlay visible")
-                # Wait for it to disappear
-                await self.page.wait_for_selector("#loading-overlay", state="hidden", timeout=5000)
-                print("   Loading complete")
-            except:
-                # If loading doesn't appear, just wait a bit
-                await asyncio.sleep(2.5)
-            
-            # Now wait for success modal
-            print("   Waiting for success modal...")
-            try:
-                await self.page.wait_for_selector("#success-modal.active", timeout=3000)
-                success_message = await self.page.text_content("#success-message")
-                print(f"   ✅ Success: {success_message}")
-                
-                return ActionResult(
-                    success=True,
-                    action="confirm",
-                    message=f"Action confirmed: {success_message}",
-                    screenshot=await self.take_screenshot()
-                )
+                outcome = await self.page.evaluate(CONFIRM_OUTCOME_JS, CONFIRM_OUTCOME_TIMEOUT_MS)
             except Exception as wait_err:
-                # Success modal might not appear - check page state
-                print(f"   Success modal wait failed: {wait_err}")
+                print(f"   Result modal wait failed: {wait_err}")
+                outcome = None
+            
+            if outcome is None:
+                # Result modal might not appear - check page state
                 print("   Checking for any success indicators...")
-                screenshot = await self.take_screenshot()
+                screenshot = await self._result_screenshot()
                 
                 # Check if we're back on dashboard (success without modal)
                 try:
-                    dashboard_visible = await self.page.is_visible(".dashboard-container")
+                    dashboard_visible = await self._loc["dashboard_container"].is_visible()
                     if dashboard_visible:
                         return ActionResult(
                             success=True,
@@ -835,7 +1164,7 @@ class BrowserAutomation:
                             message="Action confirmed (dashboard visible)",
                             screenshot=screenshot
                         )
-                except:
+                except PlaywrightError:
                     pass
                 
                 # Assume success if no error modal
@@ -845,6 +1174,33 @@ class BrowserAutomation:
                     message="Action confirmed (modal check skipped)",
                     screenshot=screenshot
                 )
+            
+            if outcome["kind"] == "error":
+                print(f"   ❌ Bank reported an error: {outcome['message']}")
+                return ActionResult(
+                    success=False,
+                    action="confirm",
+                    message=f"Action failed: {outcome['message']}",
+                    screenshot=await self._failure_screenshot()
+                )
+            
+            if outcome["kind"] == "dashboard":
+                return ActionResult(
+                    success=True,
+                    action="confirm",
+                    message="Action confirmed (dashboard visible)",
+                    screenshot=await self._result_screenshot()
+                )
+            
+            success_message = outcome["message"]
+            print(f"   ✅ Success: {success_message}")
+            
+            return ActionResult(
+                success=True,
+                action="confirm",
+                message=f"Action confirmed: {success_message}",
+                screenshot=await self._result_screenshot()
+            )
         
         except Exception as e:
             print(f"   ❌ Confirmation error: {str(e)}")
@@ -852,18 +1208,18 @@ class BrowserAutomation:
                 success=False,
                 action="confirm",
                 message=f"Confirmation failed: {str(e)}",
-                screenshot=await self.take_screenshot()
+                screenshot=await self._failure_screenshot()
             )
     
     async def cancel_action(self) -> ActionResult:
         """Cancel the pending action"""
         try:
-            await self.page.click("#confirm-cancel-btn")
+            await self._loc["confirm_cancel"].click()
             return ActionResult(
                 success=True,
                 action="cancel",
                 message="Action cancelled",
-                screenshot=await self.take_screenshot()
+                screenshot=await self._result_screenshot()
             )
         except Exception as e:
             return ActionResult(False, "cancel", f"Cancel failed: {str(e)}")
@@ -871,29 +1227,30 @@ class BrowserAutomation:
     async def dismiss_modal(self) -> ActionResult:
         """Dismiss success/error modal"""
         try:
-            await self.page.click("#success-ok-btn, #error-ok-btn")
+            # A modal is either already showing or not coming, so don't wait the full action timeout
+            await self._loc["modal_ok"].click(timeout=500)
             return ActionResult(True, "dismiss", "Modal dismissed")
-        except:
+        except PlaywrightError:
+            # Timeout, closed page or detached button - callers always expect a result here
             return ActionResult(True, "dismiss", "No modal to dismiss")
     
     async def go_back_to_dashboard(self) -> ActionResult:
         """Navigate back to dashboard"""
         try:
-            # Try clicking back button
-            back_btn = await self.page.query_selector(".btn-back, [id$='-back']")
-            if back_btn:
-                await back_btn.click()
-            else:
-                # Navigate directly
-                await self.page.click(".nav-brand, .logo-icon-small")
+            # Back button of the open section, else the home link - picked and clicked in one round-trip
+            clicked = await self.page.evaluate(
+                CLICK_FIRST_VISIBLE_JS, [SELECTORS["back_button"], SELECTORS["home_link"]]
+            )
+            if not clicked:
+                return ActionResult(False, "navigate", "Navigation failed: no back button or home link visible")
             
-            await self.page.wait_for_selector("#dashboard-page.active", timeout=3000)
+            await self._loc["dashboard_page"].wait_for(timeout=3000)
             
             return ActionResult(
                 success=True,
                 action="navigate",
                 message="Returned to dashboard",
-                screenshot=await self.take_screenshot()
+                screenshot=await self._result_screenshot()
             )
         except Exception as e:
             return ActionResult(False, "navigate", f"Navigation failed: {str(e)}")
@@ -901,26 +1258,14 @@ class BrowserAutomation:
     async def view_transactions(self) -> ActionResult:
         """View transaction history"""
         try:
-            transactions = []
-            items = await self.page.query_selector_all(".transaction-item")
-            
-            for item in items[:5]:
-                title = await item.query_selector(".txn-title")
-                amount = await item.query_selector(".txn-amount")
-                date = await item.query_selector(".txn-date")
-                
-                if title and amount:
-                    transactions.append({
-                        "title": await title.text_content(),
-                        "amount": await amount.text_content(),
-                        "date": await date.text_content() if date else ""
-                    })
+            # One round-trip: the DOM walk happens inside the page
+            transactions = await self.page.evaluate(RECENT_TRANSACTIONS_JS)
             
             return ActionResult(
                 success=True,
                 action="view_transactions",
                 message=f"Found {len(transactions)} recent transactions",
-                screenshot=await self.take_screenshot(),
+                screenshot=await self._result_screenshot(),
                 data={"transactions": transactions}
             )
         
@@ -932,6 +1277,116 @@ class BrowserAutomation:
             )
 
 
+# Shared Playwright driver and browser: launched once per process and reused
+# by every BrowserAutomation, which only opens its own context
+_playwright = None
+_shared_browser: Optional[Browser] = None
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+_pool_lock: Optional[asyncio.Lock] = None
+
+
+async def _launch_browser(playwright) -> Browser:
+    """Launch the configured browser with optimized settings"""
+    browser_type = config.browser_type if config.browser_type in BROWSER_TYPES else "chromium"
+    browser_launcher = getattr(playwright, browser_type)
+    launch_args = CHROMIUM_ARGS if browser_type == "chromium" else []
+    
+    browser = await browser_launcher.launch(
+        headless=config.headless,
+        slow_mo=config.slow_mo,
+        args=launch_args
+    )
+    
+    print(f"🌐 Browser started ({config.browser_type}) - Optimized mode")
+    return browser
+
+
+async def _open_context(browser: Browser) -> Tuple[BrowserContext, Page]:
+    """Open an isolated context and page with optimized settings"""
+    state_file = config.browser_state_file
+    context = await browser.new_context(
+        viewport={"width": 1280, "height": 800},
+        # Optimize network and caching for speed
+        bypass_csp=True,
+        ignore_https_errors=True,
+        # Reuse a saved login from an earlier run
+        storage_state=state_file if state_file and os.path.exists(state_file) else None
+    )
+    context.set_default_timeout(ACTION_TIMEOUT_MS)
+    context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+    
+    # Lets take_screenshot() tell whether the page changed since the last capture
+    await context.add_init_script(DOM_VERSION_INIT_JS)
+    
+    # Block unnecessary resources for faster page loads
+    await context.route(BLOCKED_RESOURCES, lambda route: route.abort())
+    await context.route(BLOCKED_HOSTS, lambda route: route.abort())
+    
+    return context, await context.new_page()
+
+
+async def get_shared_browser() -> Browser:
+    """Get the process-wide browser, launching it on first use"""
+    global _playwright, _shared_browser, _pool_loop, _pool_lock
+    
+    # Playwright objects belong to the event loop that created them
+    loop = asyncio.get_running_loop()
+    if _pool_loop is not loop:
+        _playwright = _shared_browser = None
+        _pool_loop, _pool_lock = loop, asyncio.Lock()
+    
+    async with _pool_lock:
+        if _shared_browser is None or not _shared_browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _shared_browser = await _launch_browser(_playwright)
+    
+    return _shared_browser
+
+
+async def shutdown_browser_pool():
+    """Close the shared browser and Playwright driver (at process exit)"""
+    global _playwright, _shared_browser
+    
+    if _pool_loop is asyncio.get_running_loop():
+        if _shared_browser:
+            await _shared_browser.close()
+        if _playwright:
+            await _playwright.stop()
+        print("🌐 Browser closed")
+    
+    _playwright = _shared_browser = None
+
+
+class TabPool:
+    """
+    Bounded pool of isolated contexts on the shared browser
+    
+    Lets many concurrent sessions run in one browser process; acquire()
+    waits while max_tabs contexts are in use.
+    """
+    
+    def __init__(self, max_tabs: int = 8):
+        self.max_tabs = max_tabs
+        self._semaphore = asyncio.Semaphore(max_tabs)
+    
+    async def acquire(self) -> Tuple[BrowserContext, Page]:
+        """Wait for a free slot and open a fresh context and page"""
+        await self._semaphore.acquire()
+        try:
+            return await _open_context(await get_shared_browser())
+        except BaseException:
+            self._semaphore.release()
+            raise
+    
+    async def release(self, context: BrowserContext):
+        """Close a context and free its slot"""
+        try:
+            await context.close()
+        finally:
+            self._semaphore.release()
+
+
 # Convenience function to create and start browser
 async def create_browser() -> BrowserAutomation:
     """Create and start a browser automation instance"""
@@ -3,9 +3,13 @@ Configuration settings for FinAgent
 """
 
 import os
+import queue
+import atexit
 import random
+import logging
+import logging.handlers
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from pathlib import Path
 
 # Load .env file
@@ -35,6 +39,59 @@ def get_gemini_api_keys() -> List[str]:
     return keys
 
 
+def get_audit_sample_rates() -> Dict[str, float]:
+    """
+    Parse AUDIT_SAMPLE_RATES, e.g. "browser_action=0.1,vision_analysis=0.5"
+    
+    Keys are audit action types; values are the fraction of successful
+    entries of that type to keep.
+    """
+    rates = {}
+    
+    for item in os.getenv("AUDIT_SAMPLE_RATES", "").split(","):
+        action, sep, rate = item.partition("=")
+        if sep:
+            rates[action.strip()] = float(rate)
+    
+    return rates
+
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_console_logging(level: Optional[str] = None) -> logging.handlers.QueueListener:
+    """
+    Route log records to the console through a background thread
+    
+    The root logger gets a QueueHandler, whose emit() is a non-blocking
+    queue put, so coroutines never wait on terminal I/O. A QueueListener
+    thread does the actual writes. Safe to call more than once.
+    
+    Args:
+        level: Level for the "finagent" loggers (defaults to LOG_LEVEL env
+            var, then INFO). Other libraries stay at WARNING.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return _log_listener
+    
+    log_queue = queue.Queue(-1)
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    root = logging.getLogger()
+    root.setLevel(logging.WARNING)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    logging.getLogger("finagent").setLevel(level or os.getenv("LOG_LEVEL", "INFO"))
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    return _log_listener
+
+
 def calculate_backoff_delay(attempt: int, base_delay: float = 2.0, max_delay: float = 60.0) -> float:
     """
     Calculate exponential backoff delay with jitter
@@ -75,10 +132,15 @@ class Config:
     vision_enabled: bool = True
     vision_model: str = "gemini-2.0-flash"
     
+    # Deployment environment ("production" turns off slow_mo)
+    environment: str = "development"
+    
     # Browser Settings
     browser_type: str = "chromium"
     headless: bool = False
     slow_mo: int = 100
+    # Saved cookies/localStorage so a bank login survives restarts (empty disables)
+    browser_state_file: str = ""
     
     # Target Banking Website
     bank_url: str = "http://localhost:8080"
@@ -91,6 +153,13 @@ class Config:
     log_level: str = "INFO"
     log_file: str = "logs/agent.log"
     
+    # Number of recent commands kept in memory by the agent
+    command_history_size: int = 200
+    
+    # Audit trail filtering: all, writes_only, mutations_only, failures_only
+    audit_level: str = "all"
+    audit_sample_rates: Dict[str, float] = field(default_factory=dict)
+    
     def __post_init__(self):
         # Load from environment
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -105,14 +174,19 @@ class Config:
         self.browser_type = os.getenv("BROWSER_TYPE", "chromium")
         # Default to headless=true for production
         self.headless = os.getenv("HEADLESS", "true").lower() == "true"
-        # Lower slow_mo for production
-        self.slow_mo = int(os.getenv("SLOW_MO", "50"))
+        self.environment = os.getenv("ENVIRONMENT", "development").lower()
+        # slow_mo delays every browser action, so it is off in production
+        self.slow_mo = 0 if self.environment == "production" else int(os.getenv("SLOW_MO", "50"))
+        self.browser_state_file = os.getenv("BROWSER_STATE_FILE", "")
         
         self.bank_url = os.getenv("BANK_URL", "http://localhost:8080")
         self.approval_timeout = int(os.getenv("APPROVAL_TIMEOUT", "60"))
         
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         self.log_file = os.getenv("LOG_FILE", "logs/agent.log")
+        self.command_history_size = int(os.getenv("COMMAND_HISTORY_SIZE", "200"))
+        self.audit_level = os.getenv("AUDIT_LEVEL", "all").lower()
+        self.audit_sample_rates = get_audit_sample_rates()
         
         if self.require_approval_for is None:
             self.require_approval_for = [
@@ -189,6 +263,10 @@ ACTIONS = {
 }
 
 
+# Actions that only read state and are safe to serve from a short-lived cache
+READ_ONLY_ACTIONS = {"check_balance", "view_profile", "view_transactions"}
+
+
 # Intent keywords mapping
 INTENT_KEYWORDS = {
     "login": ["login", "sign in", "log in", "authenticate", "enter"],
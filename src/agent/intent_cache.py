@@ -0,0 +1,130 @@
+"""
+Intent Cache - Persistent Parsed-Intent Caching
+
+Stores AI-parsed intents on disk keyed by the normalized command text,
+so repeating a command does not need another LLM call - even across runs.
+"""
+
+import json
+import logging
+import time
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger("finagent.intent_cache")
+
+
+# Bump when the ParsedIntent schema changes to ignore old cache files
+INTENT_CACHE_VERSION = 1
+
+
+class IntentCache:
+    """
+    File-backed cache for parsed intents
+    
+    Features:
+    - One JSON file per command under the cache directory
+    - TTL-based expiration
+    - Schema version check
+    - Hit rate tracking
+    """
+    
+    def __init__(self, cache_dir: str = ".cache/intents", ttl_seconds: int = 7 * 24 * 3600):
+        """
+        Initialize intent cache
+        
+        Args:
+            cache_dir: Directory holding the cache files
+            ttl_seconds: Time-to-live for cached intents
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+    
+    def _make_path(self, command: str) -> Path:
+        """Cache file path for a command (case and whitespace insensitive)"""
+        normalized = " ".join(command.lower().split())
+        key = hashlib.md5(normalized.encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, command: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached intent (as ParsedIntent.to_dict()) for a command
+        
+        Returns None if the command is not cached, the entry expired,
+        or it was written with a different schema version.
+        """
+        path = self._make_path(command)
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        
+        expired = time.time() - entry.get("cached_at", 0) > self.ttl_seconds
+        if expired or entry.get("version") != INTENT_CACHE_VERSION:
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return entry["intent"]
+    
+    def set(self, command: str, intent: Dict[str, Any]):
+        """Cache a parsed intent (as ParsedIntent.to_dict())"""
+        entry = {
+            "version": INTENT_CACHE_VERSION,
+            "cached_at": time.time(),
+            "intent": intent
+        }
+        
+        try:
+            with open(self._make_path(command), 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to write intent cache: {e}")
+    
+    def invalidate_all(self):
+        """Delete all cached intents"""
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total_requests = self.hits + self.misses
+        hit_rate = self.hits / total_requests if total_requests > 0 else 0
+        
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(hit_rate * 100, 2),
+            "api_calls_saved": self.hits
+        }
+
+
+# Global intent cache instance
+_intent_cache: Optional[IntentCache] = None
+
+
+def get_intent_cache() -> IntentCache:
+    """Get or create global intent cache"""
+    global _intent_cache
+    if _intent_cache is None:
+        _intent_cache = IntentCache()
+    return _intent_cache
+
+
+def init_intent_cache(cache_dir: str = ".cache/intents", ttl_seconds: int = 7 * 24 * 3600) -> IntentCache:
+    """Initialize global intent cache with custom settings"""
+    global _intent_cache
+    _intent_cache = IntentCache(cache_dir=cache_dir, ttl_seconds=ttl_seconds)
+    return _intent_cache
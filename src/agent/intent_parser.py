@@ -7,10 +7,12 @@ Falls back to keyword matching if AI is unavailable.
 
 import json
 import re
+import asyncio
 from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from .config import config, INTENT_KEYWORDS, ACTIONS
+from .intent_cache import get_intent_cache
 
 
 @dataclass
@@ -39,9 +41,13 @@ class IntentParser:
         self.use_ai = use_ai
         self.ai_client = None
         self._gemini_model_name = None
+        self.cache = None
         
         if use_ai:
             self._init_ai_client()
+            # Persist AI results so repeated commands skip the LLM call
+            if self.ai_client:
+                self.cache = get_intent_cache()
     
     def _init_ai_client(self):
         """Initialize AI client based on configuration"""
@@ -71,13 +77,30 @@ class IntentParser:
         
         # Try AI-based parsing first
         if self.use_ai and self.ai_client:
+            cached = self.cache.get(command) if self.cache else None
+            if cached:
+                return ParsedIntent(**{**cached, "original_command": command})
+            
             intent = self._parse_with_ai(command)
             if intent and intent.confidence > 0.7:
+                if self.cache:
+                    self.cache.set(command, intent.to_dict())
                 return intent
         
         # Fall back to keyword matching
         return self._parse_with_keywords(command)
     
+    async def parse_async(self, command: str) -> ParsedIntent:
+        """
+        parse() for async callers
+        
+        AI parsing makes a blocking HTTP call, so it runs in a worker thread
+        to keep the event loop free; keyword-only parsing stays inline.
+        """
+        if self.use_ai and self.ai_client:
+            return await asyncio.to_thread(self.parse, command)
+        return self.parse(command)
+    
     def _parse_with_ai(self, command: str) -> Optional[ParsedIntent]:
         """Use AI to parse the command with retry and key rotation"""
         
@@ -9,6 +9,7 @@ Tracks and reports performance metrics for FinAgent:
 - Session analytics
 """
 
+import logging
 import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -17,6 +18,9 @@ from contextlib import contextmanager
 from collections import defaultdict
 
 
+logger = logging.getLogger("finagent.metrics")
+
+
 @dataclass
 class TimingMetric:
     """Single timing measurement"""
@@ -85,7 +89,7 @@ class PerformanceMetrics:
         # Error tracking
         self.errors: List[Dict[str, Any]] = []
         
-        print("📊 Performance Metrics initialized")
+        logger.info("📊 Performance Metrics initialized")
     
     # Command Tracking
     def start_command(self, command: str, action: str, approval_required: bool = False):
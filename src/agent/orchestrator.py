@@ -8,6 +8,7 @@ Uses LangGraph-style orchestration for complex tasks:
 - Coordinates between Intent Parser, Browser, and Conscious Pause
 """
 
+import logging
 import asyncio
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
@@ -20,6 +21,9 @@ from .browser_automation import BrowserAutomation, ActionResult
 from .conscious_pause import ConciousPause, ApprovalStatus
 
 
+logger = logging.getLogger("finagent.orchestrator")
+
+
 class TaskStatus(Enum):
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -96,11 +100,12 @@ class TaskOrchestrator:
         self.on_approval_needed = None
         self.on_task_complete = None
     
-    async def process_command(self, command: str) -> Task:
-        """Process a natural language command"""
+    async def process_command(self, command: str, intent: Optional[ParsedIntent] = None) -> Task:
+        """Process a natural language command (reusing intent if already parsed)"""
         
         # Parse intent
-        intent = self.intent_parser.parse(command)
+        if intent is None:
+            intent = await self.intent_parser.parse_async(command)
         
         if intent.action == "unknown":
             return self._create_failed_task(
@@ -133,9 +138,9 @@ class TaskOrchestrator:
         
         self.tasks[task_id] = task
         
-        print(f"\n📋 Created {task_id} with {len(steps)} steps")
+        logger.info(f"📋 Created {task_id} with {len(steps)} steps")
         for step in steps:
-            print(f"   {step.id}. {step.action}")
+            logger.info(f"   {step.id}. {step.action}")
         
         return task
     
@@ -297,7 +302,7 @@ class TaskOrchestrator:
         for i, step in enumerate(task.steps):
             task.current_step = i + 1
             
-            print(f"\n▶️  Step {step.id}/{len(task.steps)}: {step.action}")
+            logger.info(f"▶️  Step {step.id}/{len(task.steps)}: {step.action}")
             
             if self.on_step_start:
                 await self.on_step_start(task, step)
@@ -310,11 +315,11 @@ class TaskOrchestrator:
                 
                 if result.success:
                     step.status = TaskStatus.COMPLETED
-                    print(f"   ✅ {result.message}")
+                    logger.info(f"   ✅ {result.message}")
                 else:
                     step.status = TaskStatus.FAILED
                     step.error = result.message
-                    print(f"   ❌ {result.message}")
+                    logger.warning(f"   ❌ {result.message}")
                     
                     # Stop on failure
                     task.status = TaskStatus.FAILED
@@ -327,7 +332,7 @@ class TaskOrchestrator:
                 step.status = TaskStatus.FAILED
                 step.error = str(e)
                 task.status = TaskStatus.FAILED
-                print(f"   ❌ Error: {e}")
+                logger.warning(f"   ❌ Error: {e}")
                 break
             
             # Small delay between steps for visibility
@@ -343,7 +348,7 @@ class TaskOrchestrator:
             await self.on_task_complete(task)
         
         status_emoji = "✅" if task.status == TaskStatus.COMPLETED else "❌"
-        print(f"\n{status_emoji} Task {task.id} {task.status.value}")
+        logger.info(f"{status_emoji} Task {task.id} {task.status.value}")
     
     async def _execute_step(self, step: TaskStep) -> ActionResult:
         """Execute a single step"""
@@ -418,15 +423,15 @@ class TaskOrchestrator:
             await self.on_approval_needed(request)
         
         # Wait for approval
-        print(f"⏳ Waiting for user approval for {request.id}...")
+        logger.info(f"⏳ Waiting for user approval for {request.id}...")
         status = await self.conscious_pause.wait_for_approval(request)
-        print(f"✅ Approval status received: {status.value}")
+        logger.info(f"✅ Approval status received: {status.value}")
         
         if status == ApprovalStatus.APPROVED:
             # Proceed with confirmation
-            print("   Confirming action in browser...")
+            logger.info("   Confirming action in browser...")
             result = await self.browser.confirm_action()
-            print(f"   Confirmation result: {result.success}")
+            logger.info(f"   Confirmation result: {result.success}")
             return result
         
         elif status == ApprovalStatus.REJECTED:
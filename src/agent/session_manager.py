@@ -9,6 +9,7 @@ Provides session state management for FinAgent:
 - Auto-save functionality
 """
 
+import logging
 import json
 import asyncio
 from datetime import datetime
@@ -17,6 +18,9 @@ from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, asdict, field
 
 
+logger = logging.getLogger("finagent.session")
+
+
 @dataclass
 class SessionState:
     """Complete session state"""
@@ -65,6 +69,7 @@ class SessionManager:
         self.auto_save = auto_save
         self.auto_save_interval = auto_save_interval
         self._auto_save_task: Optional[asyncio.Task] = None
+        self._dirty = False  # Changes waiting for the next auto-save
         
         # Initialize or load session
         if session_id:
@@ -74,7 +79,7 @@ class SessionManager:
         
         self.session_file = self.session_dir / f"session_{self.state.session_id}.json"
         
-        print(f"📁 Session Manager initialized (ID: {self.state.session_id[:8]}...)")
+        logger.info(f"📁 Session Manager initialized (ID: {self.state.session_id[:8]}...)")
     
     def _generate_session_id(self) -> str:
         """Generate unique session ID"""
@@ -98,22 +103,23 @@ class SessionManager:
             try:
                 with open(session_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                print(f"📂 Loaded existing session: {session_id[:8]}...")
+                logger.info(f"📂 Loaded existing session: {session_id[:8]}...")
                 return SessionState.from_dict(data)
             except Exception as e:
-                print(f"⚠️ Failed to load session: {e}")
+                logger.warning(f"⚠️ Failed to load session: {e}")
         
         return None
     
     def save(self):
         """Save current session state to disk"""
         self.state.updated_at = datetime.now().isoformat()
+        self._dirty = False
         
         try:
             with open(self.session_file, 'w', encoding='utf-8') as f:
                 json.dump(self.state.to_dict(), f, indent=2)
         except Exception as e:
-            print(f"⚠️ Failed to save session: {e}")
+            logger.warning(f"⚠️ Failed to save session: {e}")
     
     def load(self) -> bool:
         """Load session state from disk"""
@@ -124,7 +130,7 @@ class SessionManager:
                 self.state = SessionState.from_dict(data)
                 return True
             except Exception as e:
-                print(f"⚠️ Failed to load session: {e}")
+                logger.warning(f"⚠️ Failed to load session: {e}")
         return False
     
     # Login State Management
@@ -164,7 +170,7 @@ class SessionManager:
             self.save_cookies(cookies)
             return True
         except Exception as e:
-            print(f"⚠️ Failed to save browser cookies: {e}")
+            logger.warning(f"⚠️ Failed to save browser cookies: {e}")
             return False
     
     async def restore_cookies_to_browser(self, browser_context) -> bool:
@@ -174,10 +180,10 @@ class SessionManager:
         
         try:
             await browser_context.add_cookies(self.state.cookies)
-            print(f"🍪 Restored {len(self.state.cookies)} cookies")
+            logger.info(f"🍪 Restored {len(self.state.cookies)} cookies")
             return True
         except Exception as e:
-            print(f"⚠️ Failed to restore cookies: {e}")
+            logger.warning(f"⚠️ Failed to restore cookies: {e}")
             return False
     
     # Command History
@@ -193,9 +199,17 @@ class SessionManager:
         
         # Keep last 100 commands
         if len(self.state.command_history) > 100:
-            self.state.command_history = self.state.command_history[-100:]
+            del self.state.command_history[:-100]
         
-        self.save()
+        # Commands can arrive in bursts; batch them into the auto-save cycle
+        self._save_deferred()
+    
+    def _save_deferred(self):
+        """Save now, or on the next auto-save when that loop is running"""
+        if self._auto_save_task is None:
+            self.save()
+        else:
+            self._dirty = True
     
     def get_command_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent command history"""
@@ -277,6 +291,10 @@ class SessionManager:
             except asyncio.CancelledError:
                 pass
             self._auto_save_task = None
+            
+            # Write anything batched since the last auto-save
+            if self._dirty:
+                self.save()
     
     async def _auto_save_loop(self):
         """Background auto-save loop"""
@@ -351,7 +369,7 @@ class SessionManager:
             self.save()
             return True
         except Exception as e:
-            print(f"⚠️ Failed to import session: {e}")
+            logger.warning(f"⚠️ Failed to import session: {e}")
             return False
 
 
@@ -13,13 +13,18 @@ This module implements the core innovation of FinAgent:
 
 import json
 import re
-import base64
 import asyncio
 import random
 import time
 from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass
 
+try:
+    # SIMD decoder with the stdlib signature
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
 from .config import config
 from .element_cache import get_element_cache
 from .metrics import get_metrics
@@ -97,6 +102,16 @@ class VisionModule:
         except Exception as e:
             print(f"⚠️ Vision module init error: {e}")
     
+    async def warmup(self):
+        """Open the API connection ahead of the first vision call (a model lookup, nothing generated)"""
+        if not self.client:
+            return
+        
+        try:
+            await self.client.aio.models.get(model=self.current_model_name)
+        except Exception as e:
+            print(f"⚠️ Vision warmup failed: {e}")
+    
     def _switch_api_key(self):
         """Switch to next API key on rate limit"""
         try:
@@ -127,14 +142,14 @@ class VisionModule:
         
         for attempt in range(max_retries):
             try:
-                # Use the new google.genai API structure
-                response = self.client.models.generate_content(
+                # Async client: keeps its connection pool and does not block the event loop
+                response = await self.client.aio.models.generate_content(
                     model=self.current_model_name,
                     contents=[
                         types.Content(
                             parts=[
                                 types.Part.from_text(text=prompt),
-                                types.Part.from_bytes(data=image_bytes, mime_type="image/png")
+                                types.Part.from_bytes(data=image_bytes, mime_type="image/jpeg")
                             ]
                         )
                     ]
@@ -252,10 +267,10 @@ Return JSON:
     "selector_hint": "CSS selector if visible"
 }}
 
-Image size: ~1280x800px. If not found: found=false, x=0, y=0."""
+Coordinates are pixels of this image. If not found: found=false, x=0, y=0."""
 
         try:
-            image_bytes = base64.b64decode(screenshot_base64)
+            image_bytes = b64decode(screenshot_base64)
             response = await self._call_with_retry(prompt, image_bytes)
             result = self._parse_json_response(response.text)
             
@@ -307,6 +322,73 @@ Image size: ~1280x800px. If not found: found=false, x=0, y=0."""
             confidence=0.0
         )
     
+    async def find_elements(
+        self,
+        screenshot_base64: str,
+        element_descriptions: List[str],
+        element_type: str = "input"
+    ) -> List[ElementLocation]:
+        """
+        Find several UI elements in one screenshot with a single model call
+        
+        Args:
+            screenshot_base64: Base64 encoded screenshot
+            element_descriptions: What to find, e.g. every field of a form
+            element_type: Type of the elements (button, input, link, text)
+        
+        Returns:
+            One ElementLocation per description, in the same order
+        """
+        locations = [
+            ElementLocation(found=False, element_type=element_type, description=description)
+            for description in element_descriptions
+        ]
+        if not self.client or not element_descriptions:
+            return locations
+        
+        start_time = time.time()
+        
+        targets = "\n".join(f'{i + 1}. "{description}"' for i, description in enumerate(element_descriptions))
+        prompt = f"""Find these {element_type} elements in this screenshot:
+{targets}
+
+Return JSON with one entry per element, in the same order:
+{{
+    "elements": [
+        {{"found": true/false, "x": center_x_pixel, "y": center_y_pixel, "confidence": 0-1}}
+    ]
+}}
+
+Coordinates are pixels of this image. If an element is not found: found=false, x=0, y=0."""
+
+        try:
+            image_bytes = b64decode(screenshot_base64)
+            response = await self._call_with_retry(prompt, image_bytes)
+            result = self._parse_json_response(response.text)
+            entries = result.get("elements", []) if result else []
+            
+            for location, entry in zip(locations, entries):
+                if not isinstance(entry, dict):
+                    continue
+                location.x = entry.get("x", 0)
+                location.y = entry.get("y", 0)
+                location.confidence = entry.get("confidence", 0.0)
+                location.found = bool(entry.get("found")) and location.x > 0 and location.y > 0
+            
+            # Record vision call metrics
+            duration_ms = (time.time() - start_time) * 1000
+            self.metrics.record_vision_call(
+                operation="find_elements",
+                duration_ms=duration_ms,
+                element_found=all(location.found for location in locations),
+                confidence=min(location.confidence for location in locations)
+            )
+        
+        except Exception as e:
+            print(f"⚠️ Vision find_elements error: {e}")
+        
+        return locations
+    
     async def analyze_page(self, screenshot_base64: str) -> PageAnalysis:
         """
         Analyze the current page state and available elements
@@ -341,7 +423,7 @@ JSON only:
 }"""
 
         try:
-            image_bytes = base64.b64decode(screenshot_base64)
+            image_bytes = b64decode(screenshot_base64)
             response = await self._call_with_retry(prompt, image_bytes)
             result = self._parse_json_response(response.text)
             
@@ -400,7 +482,7 @@ RESPOND IN THIS EXACT JSON FORMAT:
 ONLY return the JSON, no other text."""
 
         try:
-            image_bytes = base64.b64decode(screenshot_base64)
+            image_bytes = b64decode(screenshot_base64)
             response = await self._call_with_retry(prompt, image_bytes)
             result = self._parse_json_response(response.text)
             
@@ -440,7 +522,7 @@ RESPOND with ONLY the extracted text, nothing else.
 If text is not found, respond with "NOT_FOUND"."""
 
         try:
-            image_bytes = base64.b64decode(screenshot_base64)
+            image_bytes = b64decode(screenshot_base64)
             response = await self._call_with_retry(prompt, image_bytes)
             text = response.text.strip()
             
@@ -13,6 +13,8 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional
 from contextlib import asynccontextmanager
 
+import orjson
+
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, HTMLResponse
@@ -24,6 +26,8 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from src.agent.agent import FinAgent
+from src.agent.browser_automation import shutdown_browser_pool
+from src.agent.config import setup_console_logging
 from src.agent.conscious_pause import ApprovalRequest
 
 
@@ -64,9 +68,11 @@ class ConnectionManager:
     
     async def broadcast(self, message: Dict[str, Any]):
         """Send message to all connected clients"""
-        for connection in self.active_connections:
+        # Encode once for every client (screenshots make these payloads large)
+        payload = orjson.dumps(message, default=str).decode()
+        for connection in list(self.active_connections):
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except:
                 self.disconnect(connection)
     
@@ -137,6 +143,7 @@ async def lifespan(app: FastAPI):
     global agent
     
     # Startup
+    setup_console_logging()
     print("🚀 Starting FinAgent Server...")
     agent = FinAgent()
     
@@ -151,6 +158,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     if agent and agent.is_running:
         await agent.stop()
+    await shutdown_browser_pool()
     print("👋 Server stopped")
 
 
@@ -330,7 +338,7 @@ async def get_history():
     if not agent:
         return {"history": []}
     
-    return {"history": agent.command_history}
+    return {"history": agent.get_command_history()}
 
 
 # ===== WebSocket Endpoint =====
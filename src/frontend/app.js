@@ -1,6 +1,9 @@
 // FinAgent AI - Frontend Application
 // Modern, fast, and feature-rich UI with voice control
 
+// Screenshots arrive as base64 JPEG
+const SCREENSHOT_DATA_URI = 'data:image/jpeg;base64,';
+
 // ===== Global State =====
 const state = {
     ws: null,
@@ -78,8 +81,11 @@ function handleMessage(message) {
     
     switch (type) {
         case 'status':
-            addActivity('info', text || 'Status update', timestamp);
-            addLog('info', text || 'Status update');
+            // The agent batches status updates, one per line
+            (text || 'Status update').split('\n').forEach(line => {
+                addActivity('info', line, timestamp);
+                addLog('info', line);
+            });
             break;
             
         case 'screenshot':
@@ -326,7 +332,7 @@ function updateAgentStatus(status, text) {
 
 function updateBrowserScreenshot(base64Data) {
     const img = document.getElementById('browserScreenshot');
-    img.src = `data:image/png;base64,${base64Data}`;
+    img.src = SCREENSHOT_DATA_URI + base64Data;
 }
 
 function updateStats() {
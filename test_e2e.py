@@ -14,11 +14,6 @@ Usage:
 import asyncio
 import subprocess
 import time
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.agent.agent import FinAgent
 from src.agent.config import config
@@ -228,6 +223,9 @@ async def run_all_tests():
     results["browser"] = await test_browser_automation()
     results["agent"] = await test_full_agent()
     
+    from src.agent.browser_automation import shutdown_browser_pool
+    await shutdown_browser_pool()
+    
     # Summary
     print("\n" + "="*60)
     print("📊 Test Results Summary")
@@ -4,13 +4,9 @@ Test script to verify Gemini Vision API is working
 
 import asyncio
 import sys
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from agent.vision import VisionModule
-from agent.config import config
+from src.agent.vision import VisionModule
+from src.agent.config import config
 
 
 async def test_vision_api():
@@ -3,13 +3,8 @@ Pytest Configuration and Fixtures
 """
 
 import pytest
-import sys
 from pathlib import Path
 
-# Add src to path for imports
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 
 @pytest.fixture(scope="session")
 def project_root():
@@ -0,0 +1,167 @@
+"""
+Unit Tests for Audit Logger
+
+Tests buffered audit trail writing
+"""
+
+import json
+import time
+from datetime import datetime
+import pytest
+from src.agent.audit_logger import AuditLogger, ActionType
+
+
+class TestAuditLogger:
+    """Test suite for AuditLogger"""
+    
+    @pytest.fixture
+    def audit(self, tmp_path):
+        """Create audit logger writing to a temporary directory"""
+        logger = AuditLogger(log_dir=str(tmp_path))
+        yield logger
+        logger.close()
+    
+    def read_trail(self, audit):
+        """Read written audit entries"""
+        text = audit.audit_buffer.path.read_text(encoding="utf-8")
+        return [json.loads(line) for line in text.splitlines()]
+    
+    def test_log_is_buffered_until_flush(self, audit):
+        """Test entries reach the file on flush"""
+        audit.log_command("check my balance")
+        audit.log_command("view profile")
+        audit.flush()
+        
+        entries = self.read_trail(audit)
+        
+        assert [e["details"]["command"] for e in entries] == ["check my balance", "view profile"]
+        assert entries[0]["action_type"] == ActionType.COMMAND_RECEIVED.value
+        assert entries[0]["session_id"] == audit.session_id[:8]
+    
+    def test_close_drains_pending_entries(self, audit):
+        """Test closing writes everything still queued"""
+        for i in range(10):
+            audit.log_command(f"command {i}")
+        audit.close()
+        
+        assert len(self.read_trail(audit)) == 10
+    
+    def test_timestamp_formatted_on_export(self, audit):
+        """Test entries store nanoseconds and serialize ISO timestamps"""
+        entry = audit.log_command("check my balance")
+        
+        assert isinstance(entry.timestamp_ns, int)
+        
+        data = entry.to_dict()
+        
+        assert "timestamp_ns" not in data
+        assert datetime.fromisoformat(data["timestamp"]).timestamp() == pytest.approx(entry.timestamp_ns / 1e9)
+    
+    def test_export_session_log(self, audit, tmp_path):
+        """Test session export writes summary and entries"""
+        audit.log_command("check my balance")
+        audit.log_error("timeout", "Page load timed out", context={1: "retry"})
+        
+        path = audit.export_session_log(str(tmp_path / "session.json"))
+        
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        
+        assert data["session_id"] == audit.session_id
+        assert data["summary"]["error_count"] == 1
+        assert data["entries"][1]["details"]["context"] == {"1": "retry"}
+    
+    def test_recent_entries_bounded(self, audit):
+        """Test only the newest max_recent entries are kept in memory"""
+        for i in range(audit.max_recent + 5):
+            audit.log_command(f"command {i}")
+        
+        assert len(audit.recent_entries) == audit.max_recent
+        assert audit.recent_entries[0].details["command"] == "command 5"
+    
+    def test_full_queue_keeps_mutations_and_failures(self, audit, caplog):
+        """Test overflow drops only successful diagnostics, with a warning"""
+        buffer = audit.audit_buffer
+        buffer.max_pending = 2
+        
+        with caplog.at_level("WARNING", logger="finagent.audit"):
+            audit.log_command("first")
+            audit.log_command("second")
+            audit.log_command("dropped")
+            audit.log_transaction("pay_bill", 1500, "success")
+            
+            # Kept entries are written straight away, with the backlog ahead of them
+            assert len(self.read_trail(audit)) == 3
+            
+            audit.log_command("third")
+            audit.log_command("fourth")
+            audit.log_error("timeout", "Page load timed out")
+        
+        entries = self.read_trail(audit)
+        commands = [e["details"].get("command") for e in entries]
+        assert commands == ["first", "second", None, "third", "fourth", None]
+        assert entries[-1]["action_type"] == ActionType.ERROR_OCCURRED.value
+        assert buffer.dropped == 1
+        assert "Dropping audit entries" in caplog.text
+    
+    def test_rotates_at_midnight(self, audit):
+        """Test the trail moves to a dated backup once midnight passes"""
+        buffer = audit.audit_buffer
+        audit.log_command("before midnight")
+        audit.flush()
+        
+        buffer._rollover_at = time.time() - 1
+        day = datetime.fromtimestamp(buffer._rollover_at - 1).strftime("%Y-%m-%d")
+        audit.log_command("after midnight")
+        audit.flush()
+        
+        backup = buffer.path.with_name(f"audit.log.{day}")
+        assert json.loads(backup.read_text(encoding="utf-8"))["details"]["command"] == "before midnight"
+        assert [e["details"]["command"] for e in self.read_trail(audit)] == ["after midnight"]
+        assert buffer._rollover_at > time.time()
+    
+    def test_session_summary_counts_whole_session(self, audit):
+        """Test summary totals include entries evicted from memory"""
+        first = audit.log_command("first")
+        for i in range(audit.max_recent):
+            audit.log_command(f"command {i}")
+        audit.log_error("timeout", "Page load timed out")
+        
+        summary = audit.get_session_summary()
+        
+        assert summary["total_entries"] == audit.max_recent + 2
+        assert summary["error_count"] == 1
+        assert summary["action_breakdown"][ActionType.COMMAND_RECEIVED.value] == audit.max_recent + 1
+        assert summary["start_time"] == first.iso_timestamp
+    
+    def test_session_start_records_full_id(self, audit):
+        """Test only the session header carries the full session id"""
+        start = audit.log(ActionType.SESSION_START, {"bank_url": "http://localhost:8080"})
+        command = audit.log_command("check my balance")
+        
+        assert start.session_id == audit.session_id
+        assert command.session_id == audit.short_session_id
+    
+    def test_audit_level_filters_successes(self, tmp_path):
+        """Test mutations_only skips diagnostics but keeps failures"""
+        audit = AuditLogger(log_dir=str(tmp_path), audit_level="mutations_only")
+        
+        assert audit.log_browser_action("click", "#login-btn") is None
+        assert audit.log_transaction("pay_bill", 1500, "success") is not None
+        assert audit.log_browser_action("click", "#login-btn", success=False) is not None
+        
+        audit.close()
+    
+    def test_sample_rates(self, tmp_path):
+        """Test a zero sample rate drops successful entries of that type"""
+        audit = AuditLogger(log_dir=str(tmp_path), sample_rates={"browser_action": 0.0})
+        
+        assert audit.log_browser_action("click", "#login-btn") is None
+        assert audit.log_command("check my balance") is not None
+        
+        audit.close()
+    
+    def test_unknown_audit_level(self, tmp_path):
+        """Test invalid audit levels are rejected"""
+        with pytest.raises(ValueError):
+            AuditLogger(log_dir=str(tmp_path), audit_level="verbose")
@@ -0,0 +1,90 @@
+"""
+Unit Tests for the Confirm Outcome Script
+
+Runs CONFIRM_OUTCOME_JS in Chromium against the markup Modal.jsx renders
+"""
+
+import pytest
+from src.agent.browser_automation import CONFIRM_OUTCOME_JS
+
+sync_api = pytest.importorskip("playwright.sync_api")
+
+
+# Modal.jsx output for each modal type (inside .modal.active > div)
+def modal(kind: str, message: str, buttons: str) -> str:
+    """Active modal wrapping a .modal-content of the given kind"""
+    return f"""
+    <div class="modal active">
+      <div>
+        <div class="modal-content {kind}">
+          <div class="modal-icon">!</div>
+          <h2>Title</h2>
+          <p>{message}</p>
+          {buttons}
+        </div>
+      </div>
+    </div>
+    """
+
+
+SUCCESS_MODAL = modal(
+    "success", "Your Adani Power bill has been paid.",
+    '<button class="btn btn-primary">OK</button>'
+)
+ERROR_MODAL = modal(
+    "error", "Insufficient balance",
+    '<button class="btn btn-primary">OK</button>'
+)
+CONFIRM_MODAL = modal(
+    "confirm", "Pay Rs 1500 to Adani Power?",
+    '<div class="modal-actions"><button class="btn btn-outline">Cancel</button>'
+    '<button id="confirm-proceed-btn" class="btn btn-primary">Confirm &amp; Pay</button></div>'
+)
+
+
+@pytest.fixture(scope="module")
+def page():
+    """Blank Chromium page (skipped when no browser is installed)"""
+    with sync_api.sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except sync_api.Error as e:
+            pytest.skip(f"Chromium not available: {e}")
+        yield browser.new_page()
+        browser.close()
+
+
+class TestConfirmOutcomeScript:
+    """Test suite for CONFIRM_OUTCOME_JS"""
+    
+    def outcome(self, page, html: str, timeout: int = 200):
+        """Render html and run the script"""
+        page.set_content(f"<body>{html}</body>")
+        return page.evaluate(CONFIRM_OUTCOME_JS, timeout)
+    
+    def test_success_modal(self, page):
+        """Test the success modal's message is returned"""
+        assert self.outcome(page, SUCCESS_MODAL) == {
+            "kind": "success", "message": "Your Adani Power bill has been paid."
+        }
+    
+    def test_error_modal(self, page):
+        """Test the error modal is reported as an error"""
+        assert self.outcome(page, ERROR_MODAL) == {"kind": "error", "message": "Insufficient balance"}
+    
+    def test_dashboard(self, page):
+        """Test returning to the dashboard ends the wait"""
+        assert self.outcome(page, '<div class="dashboard-container"></div>')["kind"] == "dashboard"
+    
+    def test_confirm_modal_is_not_an_outcome(self, page):
+        """Test the still-open confirm modal times out to null"""
+        assert self.outcome(page, CONFIRM_MODAL) is None
+    
+    def test_resolves_on_mutation(self, page):
+        """Test a modal rendered after the wait starts is picked up"""
+        page.set_content("<body></body>")
+        page.evaluate(
+            "(html) => setTimeout(() => { document.body.innerHTML = html; }, 50)", SUCCESS_MODAL
+        )
+        
+        assert page.evaluate(CONFIRM_OUTCOME_JS, 2000)["kind"] == "success"
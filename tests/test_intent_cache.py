@@ -0,0 +1,90 @@
+"""
+Unit Tests for Intent Cache
+
+Tests persistent parsed-intent caching
+"""
+
+import json
+import pytest
+from src.agent.intent_cache import IntentCache, INTENT_CACHE_VERSION
+
+
+class TestIntentCache:
+    """Test suite for IntentCache"""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create cache in a temporary directory"""
+        return IntentCache(cache_dir=str(tmp_path / "intents"))
+    
+    @pytest.fixture
+    def intent(self):
+        """Sample parsed intent dict"""
+        return {
+            "action": "pay_bill",
+            "confidence": 0.95,
+            "parameters": {"amount": 1500, "biller_type": "electricity"},
+            "original_command": "pay electricity bill of 1500",
+            "requires_approval": True
+        }
+    
+    def test_miss_then_hit(self, cache, intent):
+        """Test cached intent is returned after set"""
+        assert cache.get("pay electricity bill of 1500") is None
+        
+        cache.set("pay electricity bill of 1500", intent)
+        
+        assert cache.get("pay electricity bill of 1500") == intent
+        assert cache.hits == 1
+        assert cache.misses == 1
+    
+    def test_key_is_normalized(self, cache, intent):
+        """Test case and whitespace differences share an entry"""
+        cache.set("pay electricity bill of 1500", intent)
+        
+        assert cache.get("  Pay Electricity   BILL of 1500 ") == intent
+    
+    def test_persists_across_instances(self, cache, intent):
+        """Test entries survive a new cache instance on the same directory"""
+        cache.set("check my balance", intent)
+        
+        reopened = IntentCache(cache_dir=str(cache.cache_dir))
+        
+        assert reopened.get("check my balance") == intent
+    
+    def test_expired_entry(self, tmp_path, intent):
+        """Test expired entries are treated as misses"""
+        cache = IntentCache(cache_dir=str(tmp_path), ttl_seconds=-1)
+        cache.set("check my balance", intent)
+        
+        assert cache.get("check my balance") is None
+    
+    def test_version_mismatch(self, cache, intent):
+        """Test entries from another schema version are ignored"""
+        cache.set("check my balance", intent)
+        path = cache._make_path("check my balance")
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        entry["version"] = INTENT_CACHE_VERSION + 1
+        path.write_text(json.dumps(entry), encoding="utf-8")
+        
+        assert cache.get("check my balance") is None
+        assert not path.exists()
+    
+    def test_invalidate_all(self, cache, intent):
+        """Test clearing the cache"""
+        cache.set("check my balance", intent)
+        cache.invalidate_all()
+        
+        assert cache.get("check my balance") is None
+    
+    def test_stats(self, cache, intent):
+        """Test statistics reporting"""
+        cache.set("check my balance", intent)
+        cache.get("check my balance")
+        cache.get("unknown command")
+        
+        stats = cache.get_stats()
+        
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 50.0
@@ -8,6 +8,7 @@ Tests all intent parsing functionality:
 - Edge cases
 """
 
+import asyncio
 import pytest
 from src.agent.intent_parser import IntentParser, ParsedIntent, parse_intent
 from src.agent.config import ACTIONS, INTENT_KEYWORDS
@@ -270,6 +271,12 @@ class TestIntentParser:
         assert "original_command" in intent_dict
         assert "requires_approval" in intent_dict
     
+    def test_parse_async_matches_parse(self, parser):
+        """Test async parsing returns the same intent as parse()"""
+        intent = asyncio.run(parser.parse_async("transfer 5000 to Mom"))
+        
+        assert intent == parser.parse("transfer 5000 to Mom")
+    
     # ============ Actions Configuration Tests ============
     
     def test_all_actions_have_risk_level(self):